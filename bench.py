@@ -0,0 +1,129 @@
+"""Micro-benchmarks for the state and payload hot paths.
+
+    python bench.py
+
+Compares the stdlib json module with lib.codec (whichever backend is installed) on
+snapshot sizes seen in practice: a few hundred listings for most companies and a few
+thousand for the big boards. Also compares lib.embedded_json with the character-by-
+character scanner the Adobe scraper used to pull its jobs out of server-rendered pages.
+"""
+import json
+import os
+import random
+import string
+import tempfile
+import time
+
+from lib import codec, embedded_json
+from lib.state_store import StateStore
+
+SIZES = (200, 2000, 10000)
+
+
+def _word(n: int) -> str:
+    return "".join(random.choices(string.ascii_lowercase, k=n))
+
+
+def make_listings(n: int):
+    return [{
+        "id": str(1000000 + i),
+        "title": f"{_word(8).title()} {_word(10).title()} Engineer",
+        "location": random.choice(["Zürich, Switzerland", "Bern, Switzerland", "Genève, Suisse"]),
+        "department": _word(12).title(),
+        "link": f"https://jobs.example.com/job/{1000000 + i}?gh_src={_word(6)}",
+    } for i in range(n)]
+
+
+def best_of(fn, repeat: int = 5) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def report(name: str, size: int, seconds: float) -> None:
+    print(f"{name:<34} {size:>6} listings  {seconds * 1000:8.2f} ms  {size / seconds:>12,.0f} listings/s")
+
+
+def bench_parse(listings) -> None:
+    payload = json.dumps({"jobs": listings}).encode()
+    report("parse  json.loads", len(listings), best_of(lambda: json.loads(payload)))
+    report(f"parse  codec.loads ({codec.BACKEND})", len(listings), best_of(lambda: codec.loads(payload)))
+
+
+def bench_serialize(listings) -> None:
+    data = {"listings": listings}
+    report("dump   json.dumps", len(listings), best_of(lambda: json.dumps(data).encode()))
+    report(f"dump   codec.dumps ({codec.BACKEND})", len(listings), best_of(lambda: codec.dumps(data)))
+
+
+def bench_state(listings) -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        store = StateStore(os.path.join(folder, "company"))
+        store.save(listings)
+        report("state  load", len(listings), best_of(store.load))
+
+        def save_one_change():
+            changed = list(listings)
+            changed[0] = dict(changed[0], title=_word(12))
+            store.save(changed)
+
+        report("state  save (one listing changed)", len(listings), best_of(save_one_change))
+
+
+def make_ssr_page(listings) -> str:
+    """A search results page with the jobs embedded Phenom-style, after the usual markup."""
+    markup = "".join(f'<div class="card" data-x="[{i}]"><span>"{_word(20)}"</span></div>\n' for i in range(2000))
+    data = json.dumps({"eagerLoadRefineSearch": {"totalHits": len(listings), "data": {"jobs": listings}}},
+                      separators=(",", ":"))
+    return f"<html><body>{markup}<script>phApp.ddo = {data};</script>{markup}</body></html>"
+
+
+def scan_jobs(html: str) -> list:
+    """The bracket scanner AdobeJobScraper._extract_jobs used before lib.embedded_json."""
+    idx = html.find('"jobs":[{')
+    if idx == -1:
+        return []
+    start = idx + len('"jobs":')
+    bracket = 0
+    i = start
+    while i < len(html):
+        c = html[i]
+        if c == '[':
+            bracket += 1
+        elif c == ']':
+            bracket -= 1
+            if bracket == 0:
+                end = i + 1
+                break
+        elif c == '"':
+            i += 1
+            while i < len(html) and html[i] != '"':
+                if html[i] == '\\':
+                    i += 1
+                i += 1
+        i += 1
+    else:
+        return []
+    return json.loads(html[start:end])
+
+
+def bench_embedded(listings) -> None:
+    page = make_ssr_page(listings)
+    assert scan_jobs(page) == embedded_json.find_value(page, "jobs", "[{") == listings
+    report("embed  bracket scanner", len(listings), best_of(lambda: scan_jobs(page)))
+    report("embed  embedded_json.find_value", len(listings), best_of(lambda: embedded_json.find_value(page, "jobs", "[{")))
+
+
+if __name__ == "__main__":
+    random.seed(0)
+    print(f"codec backend: {codec.BACKEND}\n")
+    for size in SIZES:
+        listings = make_listings(size)
+        bench_parse(listings)
+        bench_serialize(listings)
+        bench_state(listings)
+        bench_embedded(listings)
+        print()
@@ -1,32 +1,23 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
-import requests
+from lib import http_client, embedded_json
+from typing import List
 import logging
-import json
-import re
 
 
 class AdobeJobListing(JobListing):
+    __slots__ = ("id", "title", "location", "link")
+
     def __init__(self, listing_id: str, title: str, location: str, link: str):
         self.id = listing_id
         self.title = title
         self.location = location
         self.link = link
 
-    def get_id(self) -> str:
-        return self.id
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "location": self.location,
-            "link": self.link
-        }
-
 
 class AdobeJobScraper(JobScraper):
+    listing_class = AdobeJobListing
+
     def __init__(self):
         super().__init__(company_name="Adobe")
         self.logo_path = "lib/adobe.png"
@@ -51,8 +42,8 @@ class AdobeJobScraper(JobScraper):
                 offset, page_size = 0, 10
 
                 while True:
-                    response = requests.get(self.url, headers=self.headers,
-                                            params={"from": offset}, timeout=15)
+                    response = http_client.get(self.url, headers=self.headers,
+                                               params={"from": offset}, timeout=15)
                     if response.status_code != 200:
                         logging.error(f"Adobe returned {response.status_code} at offset {offset}")
                         return []
@@ -103,43 +94,8 @@ class AdobeJobScraper(JobScraper):
 
     def _extract_total(self, html: str) -> int:
         """Total number of matches reported by the search page."""
-        m = re.search(r'"totalHits":(\d+)', html)
-        return int(m.group(1)) if m else None
+        return embedded_json.find_value(html, "totalHits")
 
     def _extract_jobs(self, html: str) -> list:
         """Extract jobs array from embedded Phenom SSR data."""
-        idx = html.find('"jobs":[{')
-        if idx == -1:
-            return []
-
-        start = idx + len('"jobs":')
-        bracket = 0
-        i = start
-        while i < len(html):
-            c = html[i]
-            if c == '[':
-                bracket += 1
-            elif c == ']':
-                bracket -= 1
-                if bracket == 0:
-                    end = i + 1
-                    break
-            elif c == '"':
-                i += 1
-                while i < len(html) and html[i] != '"':
-                    if html[i] == '\\':
-                        i += 1
-                    i += 1
-            i += 1
-        else:
-            return []
-
-        return json.loads(html[start:end])
-
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> AdobeJobListing:
-        return AdobeJobListing(
-            listing_id=data["id"],
-            title=data["title"],
-            location=data["location"],
-            link=data["link"]
-        )
+        return embedded_json.find_value(html, "jobs", "[{") or []
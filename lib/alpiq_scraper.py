@@ -1,38 +1,28 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
+from lib import http_client
+from typing import List, Any
 from bs4 import BeautifulSoup
-import requests
 import logging
 
 class AlpiqJobListing(JobListing):
+    __slots__ = ("id", "title", "link", "locations", "division", "position", "workload")
+    FIELDS = ("id", "title", "link", "company", "locations", "division", "position", "workload")
+    company = "Alpiq"
+
     def __init__(self, listing_id: str, title: str, link: str, locations: List[str], division: str, position: str, workload: str):
         self.id = listing_id
         self.title = title
         self.link = link
-        self.company = "Alpiq"
         self.locations = locations
         self.division = division
         self.position = position
         self.workload = workload
 
-    def get_id(self) -> str:
-        return self.id
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "link": self.link,
-            "company": self.company,
-            "locations": self.locations,
-            "division": self.division,
-            "position": self.position,
-            "workload": self.workload,
-        }
-
 
 class AlpiqJobScraper(JobScraper):
+    listing_class = AlpiqJobListing
+
     def __init__(self):
         super().__init__(company_name="Alpiq")
         self.base_url = "https://www.alpiq.com/career/open-jobs/jobs/job-page-{page}/f1-1ee0b/f2-%2A/search"
@@ -56,7 +46,7 @@ class AlpiqJobScraper(JobScraper):
 
         while True:
             url = self.base_url.format(page=page)
-            response = requests.post(url, data=self.data)
+            response = http_client.post(url, data=self.data)
             if response.status_code != 200:
                 logging.error(f"Failed to fetch page {page} (status={response.status_code})")
                 break
@@ -110,14 +100,3 @@ class AlpiqJobScraper(JobScraper):
             position=title,
             workload=workload
         )
-
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> AlpiqJobListing:
-        return AlpiqJobListing(
-            data["id"],
-            data["title"],
-            data["link"],
-            data["locations"],
-            data["division"],
-            data["position"],
-            data["workload"],
-        )
@@ -8,26 +8,22 @@ Created on Thu Sep 26 08:36:40 2024
 
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
-import requests
+from lib import http_client
+from typing import Dict, Any
 import logging
-import re
-import json
  
 class AmazonJobListing(JobListing):
+    __slots__ = ("id", "title", "location", "link")
+
     def __init__(self, listing_id: str, title:str, location: str, link: str):
         self.id = listing_id
         self.title = title
         self.location = location
         self.link = link
-        
-    def get_id(self):
-        return self.id
-
-    def to_dict(self):
-        return {"id": self.id, "title": self.title, "location": self.location, "link": self.link}
 
 class AmazonJobScraper(JobScraper):
+    listing_class = AmazonJobListing
+
     def __init__(self):
         super().__init__(company_name="Amazon")
         self.logo_path = "lib/amazon.png"
@@ -46,39 +42,33 @@ class AmazonJobScraper(JobScraper):
             'location[]': 'zurich-switzerland'
         }
         
-    def scrape(self):
-        all_jobs = []
-        total_hits = None  # Will store the total number of results once retrieved
-
+    def _fetch_page(self, offset: int) -> Dict[str, Any]:
         headers = {
             "Accept-Encoding": "gzip, deflate, br",  # prevent zstd
             "User-Agent": "Mozilla/5.0 (compatible; JobScraper/1.0)"
         }
+        params = dict(self.params, offset=offset)
+        response = http_client.get(self.url, params=params, headers=headers, timeout=20)
+        try:
+            return response.json()
+        except Exception as e:
+            logging.error(f"{self.company} - Failed to parse JSON at offset {offset}: {e}")
+            return {}
 
-        while True:
-            response = requests.get(self.url, params=self.params, headers=headers, timeout=20)
-            try:
-                data = response.json()
-            except Exception as e:
-                logging.error(f"{self.company} - Failed to parse JSON: {e}")
-                break
-
-            # Check if response contains jobs
-            if 'jobs' in data:
-                all_jobs.extend(data['jobs'])
-            else:
-                break  # Exit if no jobs found
-
-            # Check total number of hits (this is only needed for the first request)
-            if total_hits is None:
-                total_hits = data.get('hits', 0)
+    def scrape(self):
+        all_jobs = []
+        limit = self.params['result_limit']
 
-            # Increment the offset for the next request (pagination)
-            self.params['offset'] += self.params['result_limit']
+        # Only 10 results per page, so fetch page one for the hit count and then request
+        # every remaining offset at once instead of walking them one by one.
+        first = self._fetch_page(0)
+        if 'jobs' not in first:
+            return self.current_listings
+        total_hits = first.get('hits', 0)
+        pages = [first] + http_client.fetch_all(self._fetch_page, range(limit, total_hits, limit))
 
-            # Break when all jobs are fetched
-            if len(all_jobs) >= total_hits:
-                break
+        for data in pages:
+            all_jobs.extend(data.get('jobs', []))
 
         self.current_listings.extend([
             AmazonJobListing(
@@ -90,6 +80,4 @@ class AmazonJobScraper(JobScraper):
             for a in all_jobs
         ])
         return self.current_listings
-        
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> AmazonJobListing:
-        return AmazonJobListing(data["id"], data["title"], data["location"], data["link"])
+        
\ No newline at end of file
@@ -1,12 +1,10 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
-import requests
-import logging
-import re
-import json
+from lib import http_client
 
 class AppleJobListing(JobListing):
+    __slots__ = ("id", "title", "team", "description", "link")
+
     def __init__(self, listing_id: str, title:str, team: str, description: str):
         self.id = listing_id
         self.title = title
@@ -14,14 +12,10 @@ class AppleJobListing(JobListing):
         self.description = description
         self.link = "https://jobs.apple.com/de-ch/details/"+str(listing_id)
 
-    def get_id(self):
-        return self.id
-
-    def to_dict(self):
-        return {"id": self.id, "title": self.title, "team": self.team, "description": self.description, "link": self.link}
-
 
 class AppleJobScraper(JobScraper):
+    listing_class = AppleJobListing
+
     def __init__(self):
         super().__init__(company_name="Apple")
         self.logo_path = "lib/apple.png"
@@ -47,7 +41,7 @@ class AppleJobScraper(JobScraper):
 
         while True:
             self.json_data["page"] = page
-            response = requests.post('https://jobs.apple.com/api/v1/search', json=self.json_data).json()["res"]
+            response = http_client.post('https://jobs.apple.com/api/v1/search', json=self.json_data).json()["res"]
             jobs_on_page = response['searchResults']
             all_jobs.extend(jobs_on_page)
 
@@ -57,6 +51,4 @@ class AppleJobScraper(JobScraper):
 
             page += 1
         self.current_listings.extend([AppleJobListing(a["positionId"], a["postingTitle"], a["team"]["teamName"], a["jobSummary"]) for a in all_jobs])
-        return self.current_listings
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> AppleJobListing:
-        return AppleJobListing(data["id"], data["title"], data["team"], data["description"])
+        return self.current_listings
\ No newline at end of file
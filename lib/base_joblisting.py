@@ -1,14 +1,98 @@
-from abc import ABC, abstractmethod
-from typing import Dict, Any
+import hashlib
+from abc import ABC
+from typing import Dict, Any, FrozenSet, Optional, Tuple
+
+from lib import codec
+
+# Key under which to_state() stores the fingerprint next to the listing's fields.
+FINGERPRINT = "_fingerprint"
 
 
 class JobListing(ABC):
-    @abstractmethod
+    """A scraped job listing.
+
+    Subclasses declare their attributes in `__slots__`, so listings carry no per-instance
+    `__dict__`, and the slots double as the schema: `to_dict()` writes FIELDS (the slots
+    unless a subclass lists them itself, e.g. to add a class-level constant such as
+    `company`) and `from_dict()` fills the slots straight from a saved dict without going
+    through `__init__`. Listings compare and hash by class and id.
+
+    `fingerprint()` is a short hash of `to_dict()`. It is saved with the state, so
+    spotting an edited listing costs one string comparison instead of a field-by-field
+    comparison against the previous run.
+
+    `details` holds heavy fields such as descriptions, which a scraper's load_details()
+    fetches on demand. They are never saved and never part of the fingerprint.
+    """
+
+    __slots__ = ("_fingerprint", "_details")
+
+    # Keys written by to_dict(), in order. Defaults to every public slot in the class hierarchy.
+    FIELDS: Tuple[str, ...] = ()
+    _SLOTS: Tuple[str, ...] = ()
+    # Keys of a to_state() dict written with the current FIELDS.
+    _STATE_KEYS: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        slots = []
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get("__slots__", ()):
+                if name not in slots and not name.startswith("_"):
+                    slots.append(name)
+        cls._SLOTS = tuple(slots)
+        if "FIELDS" not in cls.__dict__:
+            cls.FIELDS = cls._SLOTS
+        cls._STATE_KEYS = frozenset(cls.FIELDS) | {FINGERPRINT}
+
     def get_id(self) -> str:
         """Return a unique ID for the job listing."""
-        pass
+        return self.id
 
-    @abstractmethod
     def to_dict(self) -> Dict[str, Any]:
         """Convert the job listing into a dictionary format."""
-        pass
\ No newline at end of file
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def fingerprint(self) -> str:
+        """Hash of the listing's content; changes whenever any field in to_dict() does."""
+        fingerprint = getattr(self, "_fingerprint", None)
+        if fingerprint is None:
+            fingerprint = hashlib.blake2b(codec.dumps(self.to_dict()), digest_size=8).hexdigest()
+            self._fingerprint = fingerprint
+        return fingerprint
+
+    def to_state(self) -> Dict[str, Any]:
+        """to_dict() plus the fingerprint, as the listing is persisted."""
+        state = self.to_dict()
+        state[FINGERPRINT] = self.fingerprint()
+        return state
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JobListing":
+        """Rebuild a listing from to_dict() or to_state() output. Slots missing from `data`
+        are None; a saved fingerprint is kept, so it is not recomputed."""
+        listing = cls.__new__(cls)
+        for name in cls._SLOTS:
+            setattr(listing, name, data.get(name))
+        # A dict saved with other fields than the class has now (a field was added,
+        # dropped or renamed since) gets its fingerprint recomputed from the current
+        # fields, so a schema change does not mark every saved listing as updated.
+        if data.keys() == cls._STATE_KEYS:
+            listing._fingerprint = data.get(FINGERPRINT)
+        return listing
+
+    @property
+    def details(self) -> Optional[Dict[str, Any]]:
+        return getattr(self, "_details", None)
+
+    @details.setter
+    def details(self, value: Optional[Dict[str, Any]]) -> None:
+        self._details = value
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, JobListing):
+            return NotImplemented
+        return type(self) is type(other) and self.get_id() == other.get_id()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.get_id()))
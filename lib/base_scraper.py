@@ -1,86 +1,170 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
-import json
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Optional
+import hashlib
 import os
-from datetime import datetime, timedelta
+import requests
+from lib import http_client, json_stream
+from lib.http_cache import ValidatorCache
+from lib.state_store import StateStore
+
+# Bytes read at a time by stream_items().
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class JobScraper(ABC):
+    # JobListing subclass this scraper produces; saved state is loaded back into it.
+    listing_class = None
+
     def __init__(self, company_name: str):
         self.company = company_name
         self.current_listings = []
+        self.http_cache = None
+        self._revalidated = []
 
     @abstractmethod
     def scrape(self) -> List[Any]:
         """Scrape job listings from a specific job site."""
         pass
 
+    def enable_http_cache(self, folder: str = None) -> None:
+        """Revalidate conditional GETs against the validators saved by the previous run."""
+        if folder is None:
+            folder = self.company
+        self.http_cache = ValidatorCache(os.path.join(folder, "http_cache.json"))
+
+    def fetch(self, method: str, url: str, session: Any = None, conditional: bool = False, **kwargs) -> Any:
+        """Send a request and check whether its body changed since the previous run.
+
+        Every 200 body is hashed and compared with the hash saved last time; with
+        `conditional` the previous ETag/Last-Modified are sent as well, so the server can
+        answer 304 without a body. Scrapers fetch all their pages through here and check
+        `not_modified` before parsing. Without an enabled cache this is a plain request.
+        """
+        client = session or http_client
+        if self.http_cache is None:
+            return client.request(method, url, **kwargs)
+
+        key = self._cache_key(method, url, conditional, kwargs)
+        response = client.request(method, url, **kwargs)
+        self._record(key, response)
+        return response
+
+    @contextmanager
+    def open_stream(self, url: str, session: Any = None, conditional: bool = False,
+                    **kwargs) -> Iterator[Optional[Iterator[bytes]]]:
+        """GET `url` and provide its body as an iterator of chunks, read as it arrives.
+
+        The body is hashed chunk by chunk for `not_modified`, which is therefore only
+        known once the block has exited; whatever the block left unread is read then. A
+        304 provides None; other non-200 statuses raise requests.HTTPError.
+        """
+        client = session or http_client
+        cache_key = self._cache_key("GET", url, conditional, kwargs) if self.http_cache is not None else None
+        with client.request("GET", url, stream=True, **kwargs) as response:
+            if response.status_code == 304 and cache_key is not None:
+                self._record(cache_key, response)
+                yield None
+                return
+            if response.status_code != 200:
+                if cache_key is not None:
+                    self._record(cache_key, response)
+                response.raise_for_status()
+                raise requests.HTTPError(f"Unexpected status {response.status_code} for {url}", response=response)
+
+            hasher = hashlib.sha1()
+
+            def chunks():
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    hasher.update(chunk)
+                    yield chunk
+
+            body = chunks()
+            yield body
+            # Hash whatever the caller did not read too, so the digest covers the whole body.
+            for _ in body:
+                pass
+            if cache_key is not None:
+                self._record(cache_key, response, hasher.hexdigest())
+
+    def stream_items(self, url: str, key: Optional[str] = None, session: Any = None,
+                     conditional: bool = False, **kwargs) -> Iterator[Any]:
+        """GET a JSON array (or the array under top-level `key`) and yield its elements as
+        they arrive, so a large board can be filtered without ever holding all of it.
+
+        See open_stream() for how the body is checked against the previous run; a 304
+        yields nothing.
+        """
+        with self.open_stream(url, session=session, conditional=conditional, **kwargs) as body:
+            if body is not None:
+                yield from json_stream.items(body, key)
+
+    def _cache_key(self, method: str, url: str, conditional: bool, kwargs: Dict[str, Any]) -> str:
+        """Validator cache key; with `conditional`, adds the saved validators to kwargs' headers."""
+        key = self.http_cache.key(method, url, kwargs.get("params"), kwargs.get("data"), kwargs.get("json"))
+        if conditional:
+            headers = dict(kwargs.pop("headers", None) or {})
+            headers.update(self.http_cache.conditional_headers(key))
+            kwargs["headers"] = headers
+        return key
+
+    def _record(self, key: str, response: Any, digest: str = None) -> None:
+        if response.status_code == 304:
+            self._revalidated.append(True)
+        elif response.status_code == 200:
+            self._revalidated.append(self.http_cache.stage(key, response, digest))
+        else:
+            self._revalidated.append(False)
+
+    def load_details(self, listings: List[Any]) -> None:
+        """Attach heavy per-listing fields (descriptions, qualifications) as `listing.details`.
+
+        main_scraper.py calls this for NEW listings only, so a steady-state run never
+        parses or downloads them; they are not saved either. A "summary" entry, if set, is
+        shown under the listing in the notification. Scrapers that can load details
+        override this; by default there are none.
+        """
+
+    def conditional_get(self, url: str, session: Any = None, **kwargs) -> Any:
+        """GET `url` with If-None-Match/If-Modified-Since from the previous run."""
+        return self.fetch("GET", url, session=session, conditional=True, **kwargs)
+
+    @property
+    def not_modified(self) -> bool:
+        """True if every response of this scrape was a 304 or byte-identical to the last run."""
+        return bool(self._revalidated) and all(self._revalidated)
+
     def save(self, folder: str = None) -> None:
         """Save the current state of scraped job listings."""
         if folder is None:
             folder = self.company
 
-        if not os.path.exists(folder):
-            os.makedirs(folder)
-
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        filename = os.path.join(folder, f"state_{timestamp}.json")
-
-        state = {"listings": [job.to_dict() for job in self.current_listings]}
         try:
-            with open(filename, "w") as file:
-                json.dump(state, file)
-            print(f"State saved to {filename}")
-
-            # Cleanup states older than 24 hours
-            #self._cleanup_old_states(folder, max_age_hours=24)
+            StateStore(folder).save([job.to_state() for job in self.current_listings])
+            print(f"State saved to {folder}")
         except Exception as e:
+            # Re-raised so the run does not go on to commit HTTP validators for a state
+            # that was never written.
             print(f"Failed to save state: {e}")
+            raise
 
-    def _cleanup_old_states(self, folder: str, max_age_hours: int = 24) -> None:
-        """Delete state files older than max_age_hours."""
-        try:
-            current_time = datetime.now()
-            cutoff_time = current_time - timedelta(hours=max_age_hours)
-
-            json_files = [f for f in os.listdir(folder) if f.endswith(".json") and f.startswith("state_")]
-
-            for json_file in json_files:
-                file_path = os.path.join(folder, json_file)
-                file_mtime = datetime.fromtimestamp(os.path.getmtime(file_path))
-
-                if file_mtime < cutoff_time:
-                    os.remove(file_path)
-                    print(f"Deleted old state: {json_file}")
-        except Exception as e:
-            print(f"Error cleaning up old states: {e}")
+    def has_previous_state(self, folder: str = None) -> bool:
+        """Whether a saved state exists that conditional requests can be revalidated against."""
+        return StateStore(folder or self.company).exists()
 
     def load_previous_state(self, folder: str = None) -> List[Any]:
         """Load the most recent saved state of job listings."""
         if folder is None:
             folder = self.company
 
-        if not os.path.exists(folder):
-            print(f"No folder found for {folder}.")
-            return []
-
-        json_files = [f for f in os.listdir(folder) if f.startswith("state_") and f.endswith(".json")]
-        if not json_files:
-            print(f"No previous state files found in {folder}.")
+        # State is written atomically, so a file that fails to load is real damage. Raise
+        # rather than return [], which would announce every saved job as NEW.
+        previous_listings = StateStore(folder).load()
+        if previous_listings is None:
+            print(f"No previous state found in {folder}.")
             return []
+        return [self._create_listing_from_dict(data) for data in previous_listings]
 
-        json_files.sort(key=lambda f: os.path.getmtime(os.path.join(folder, f)), reverse=True)
-        latest_file = json_files[0]
-        latest_filepath = os.path.join(folder, latest_file)
-
-        try:
-            with open(latest_filepath, "r") as file:
-                previous_listings = json.load(file)
-                return [self._create_listing_from_dict(data) for data in previous_listings.get("listings", [])]
-        except Exception as e:
-            print(f"Error loading previous state: {e}")
-            return []
-
-    @abstractmethod
     def _create_listing_from_dict(self, data: Dict[str, Any]) -> Any:
         """Convert a dictionary back into a job listing object."""
-        pass
+        return self.listing_class.from_dict(data)
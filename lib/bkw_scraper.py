@@ -1,26 +1,20 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
-import requests
-import logging
-import re
-import json
+from lib import http_client
 
 class BKWJobListing(JobListing):
+    __slots__ = ("id", "title", "description", "link")
+
     def __init__(self, listing_id: str, title:str, description: str, url: str):
         self.id = listing_id
         self.title = title
         self.description = description
         self.link = url
 
-    def get_id(self):
-        return self.id
-
-    def to_dict(self):
-        return {"id": self.id, "title": self.title,"description": self.description, "link": self.link}
-
 
 class BKWJobScraper(JobScraper):
+    listing_class = BKWJobListing
+
     def __init__(self):
         super().__init__(company_name="BKW")
         self.logo_path = "lib/bkw.png"
@@ -43,9 +37,7 @@ class BKWJobScraper(JobScraper):
         return filtered_jobs
     def scrape(self):
         all_jobs=[]
-        response = requests.get(self.url, params=self.params).json()
+        response = http_client.get(self.url, params=self.params).json()
         all_jobs = self.filter_jobs(response["data"])
         self.current_listings.extend([BKWJobListing(a["id"], a["title"], a["shadowSearchText"], a["url"]) for a in all_jobs])
-        return self.current_listings
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> BKWJobListing:
-        return BKWJobListing(data["id"], data["title"], data["description"], data["link"])
+        return self.current_listings
\ No newline at end of file
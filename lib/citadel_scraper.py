@@ -1,7 +1,5 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
-import requests
 import logging
 from bs4 import BeautifulSoup
 
@@ -9,27 +7,20 @@ from bs4 import BeautifulSoup
 # Job Listing Class
 # -------------------------------
 class CitadelJobListing(JobListing):
+    __slots__ = ("id", "title", "location", "link")
+
     def __init__(self, listing_id: str, title: str, location: str, link: str):
         self.id = listing_id
         self.title = title
         self.location = location
         self.link = link
 
-    def get_id(self):
-        return self.id
-
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "title": self.title,
-            "location": self.location,
-            "link": self.link
-        }
-
 # -------------------------------
 # Scraper Class
 # -------------------------------
 class CitadelJobScraper(JobScraper):
+    listing_class = CitadelJobListing
+
     def __init__(self):
         super().__init__(company_name="Citadel Securities")
         self.logo_path = "lib/citadel.png"
@@ -57,7 +48,7 @@ class CitadelJobScraper(JobScraper):
         all_jobs = []
 
         try:
-            response = requests.post(self.url, headers=self.headers, data=self.data)
+            response = self.fetch("POST", self.url, headers=self.headers, data=self.data)
             # Cloudflare serves an HTML challenge (not JSON) when it flags the request.
             content_type = response.headers.get("content-type", "")
             if "application/json" not in content_type:
@@ -66,6 +57,8 @@ class CitadelJobScraper(JobScraper):
                     f"(likely Cloudflare block), skipping"
                 )
                 return self.current_listings
+            if self.not_modified:
+                return self.current_listings
             json_data = response.json()
             html_content = json_data.get("content", "")
             
@@ -91,14 +84,6 @@ class CitadelJobScraper(JobScraper):
         self.current_listings.extend(all_jobs)
         return self.current_listings
 
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> CitadelJobListing:
-        return CitadelJobListing(
-            listing_id=data["id"],
-            title=data["title"],
-            location=data.get("location", "N/A"),
-            link=data.get("link", "")
-        )
-
 # -------------------------------
 # Quick test
 # -------------------------------
@@ -0,0 +1,55 @@
+import json
+from typing import Any, Union
+
+# The fastest JSON library that is installed does all state and API payload work.
+# orjson and msgspec both parse bytes directly and are several times faster than the
+# stdlib on large state files and API pages; the stdlib is always there as a fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if orjson is not None:
+    BACKEND = "orjson"
+elif msgspec is not None:
+    BACKEND = "msgspec"
+    _encoder = msgspec.json.Encoder()
+    _decoder = msgspec.json.Decoder()
+else:
+    BACKEND = "json"
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or UTF-8 bytes. Malformed input raises ValueError."""
+    if BACKEND == "orjson":
+        return orjson.loads(data)
+    if BACKEND == "msgspec":
+        try:
+            return _decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes.
+
+    Non-string dict keys (e.g. int job ids) are written as strings on every backend, as
+    the stdlib does.
+    """
+    if BACKEND == "orjson":
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    if BACKEND == "msgspec":
+        return _encoder.encode(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def read(path: str) -> Any:
+    """Parse a JSON file."""
+    with open(path, "rb") as f:
+        return loads(f.read())
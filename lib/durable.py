@@ -0,0 +1,68 @@
+import os
+import tempfile
+import threading
+from typing import Any, Set
+
+from lib import codec
+
+# Directories whose entries changed this run. Renames only become durable once the
+# directory itself is fsynced; doing that once per directory at the end of the run
+# (sync_dirs) instead of after every write keeps concurrent saves cheap.
+_dirty_dirs: Set[str] = set()
+_lock = threading.Lock()
+
+
+def _mark_dirty(folder: str) -> None:
+    with _lock:
+        _dirty_dirs.add(folder)
+
+
+def write_json(path: str, data: Any) -> None:
+    """Replace `path` with `data` as JSON so readers only ever see the old or the new file.
+
+    The JSON goes to a temp file in the same directory, is fsynced and then renamed over
+    the target. A crash at any point leaves the previous file intact.
+    """
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(codec.dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    _mark_dirty(folder)
+
+
+def append_line(path: str, line: bytes) -> None:
+    """Append one line to a log file and fsync it; a torn last line is the worst case."""
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+    with open(path, "ab") as f:
+        f.write(line + b"\n")
+        f.flush()
+        os.fsync(f.fileno())
+    _mark_dirty(folder)
+
+
+def sync_dirs() -> None:
+    """fsync every directory written to since the last call. Call once at the end of a run."""
+    with _lock:
+        folders = sorted(_dirty_dirs)
+        _dirty_dirs.clear()
+    if os.name != "posix":
+        # Directories cannot be opened for fsync on Windows; os.replace is already atomic there.
+        return
+    for folder in folders:
+        fd = os.open(folder, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
@@ -0,0 +1,55 @@
+import json
+import re
+from functools import lru_cache
+from typing import Any, Optional
+
+# Server-rendered pages (Phenom's phApp.ddo, Next.js, ...) ship their data as JSON inside
+# the HTML. The blob is located with a compiled regex and decoded with the C scanner of
+# json.JSONDecoder.raw_decode, which stops at the end of the value, so nothing is walked
+# character by character in Python.
+
+_decoder = json.JSONDecoder()
+
+NEXT_DATA = re.compile(r'<script[^>]*\bid="__NEXT_DATA__"[^>]*>\s*')
+# Each chunk of the App Router's streamed data is a JSON string literal in a push call.
+NEXT_FLIGHT = re.compile(r'self\.__next_f\.push\(\[\d+,\s*(?=")')
+
+
+@lru_cache(maxsize=None)
+def _key_pattern(key: str, prefix: str) -> "re.Pattern":
+    return re.compile(rf'"{re.escape(key)}"\s*:\s*(?={re.escape(prefix)})')
+
+
+def find_value(text: str, key: str, prefix: str = "") -> Any:
+    """The JSON value of the first `"key":` in `text` whose value starts with `prefix`.
+
+    E.g. find_value(html, "jobs", "[{") is the first non-empty jobs array of objects.
+    None if the key is not there; a malformed value raises ValueError.
+    """
+    match = _key_pattern(key, prefix).search(text)
+    if match is None:
+        return None
+    value, _ = _decoder.raw_decode(text, match.end())
+    return value
+
+
+def next_data(html: str) -> Optional[Any]:
+    """The `__NEXT_DATA__` payload of a Next.js (pages router) page, or None."""
+    match = NEXT_DATA.search(html)
+    if match is None:
+        return None
+    value, _ = _decoder.raw_decode(html, match.end())
+    return value
+
+
+def next_flight(html: str) -> str:
+    """The decoded stream data of a Next.js App Router page (`self.__next_f.push`), joined.
+
+    The chunks are JSON string literals, so they are decoded as such instead of
+    unescaping quotes by hand; find_value() can then search the result.
+    """
+    chunks = []
+    for match in NEXT_FLIGHT.finditer(html):
+        chunk, _ = _decoder.raw_decode(html, match.end())
+        chunks.append(chunk)
+    return "".join(chunks)
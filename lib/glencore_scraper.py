@@ -1,37 +1,29 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
+from lib import http_client
+from typing import List
 from urllib.parse import quote
-import requests
 import logging
 
 
 class GlencoreJobListing(JobListing):
+    __slots__ = ("id", "title", "location", "department", "link")
+    company = "Glencore"
+
     def __init__(self, listing_id: str, title: str, location: str, department: str, link: str):
         self.id = listing_id
         self.title = title
         self.location = location
         self.department = department
         self.link = link
-        self.company = "Glencore"
-
-    def get_id(self) -> str:
-        return self.id
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "location": self.location,
-            "department": self.department,
-            "link": self.link
-        }
 
 
 class GlencoreJobScraper(JobScraper):
     """Glencore's careers API is pre-filtered to the Baar (Zug) HQ, so every result is a
     Swiss role — no extra filtering needed."""
 
+    listing_class = GlencoreJobListing
+
     BASE = "https://www.glencore.com/.rest/api/v2/careers/"
     SEARCH_CRITERIA = '{"country":[""],"city":["Baar"],"commodity":["!KCC"]}'
 
@@ -49,7 +41,7 @@ class GlencoreJobScraper(JobScraper):
         try:
             url = (f"{self.BASE}?locale=en&sortBy=title-asc&offset=0&limit=100"
                    f"&searchCriteria={quote(self.SEARCH_CRITERIA)}&keyword=")
-            resp = requests.get(url, headers=self.headers, timeout=20)
+            resp = http_client.get(url, headers=self.headers, timeout=20)
             if resp.status_code != 200:
                 logging.error(f"Glencore API returned {resp.status_code}")
                 return listings
@@ -76,12 +68,3 @@ class GlencoreJobScraper(JobScraper):
         except Exception as e:
             logging.error(f"Error scraping Glencore jobs: {e}")
             return []
-
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> GlencoreJobListing:
-        return GlencoreJobListing(
-            listing_id=data["id"],
-            title=data["title"],
-            location=data["location"],
-            department=data["department"],
-            link=data["link"]
-        )
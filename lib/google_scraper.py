@@ -2,62 +2,67 @@ from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
 from typing import List, Dict, Any
 from bs4 import BeautifulSoup
-import requests
 import logging
 import re
 
 class GoogleJobListing(JobListing):
-    def __init__(self, listing_id: str, title: str, min_quali: str, pref_quali: str, link: str, location: str, division: str, position):
+    __slots__ = ("id", "title", "link", "location", "division", "position")
+    FIELDS = ("id", "title", "link", "company", "location", "division", "position")
+    company = "Google"
+
+    def __init__(self, listing_id: str, title: str, link: str, location: str, division: str, position):
         self.id = listing_id
         self.title = title
-        self.min_qualifications = min_quali
-        self.preferred_qualifications = pref_quali
         self.link = link
-        self.company = "Google"
         self.location = location
         self.division = division
         self.position = position
 
-    def get_id(self) -> str:
-        return self.id
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "min_quali": self.min_qualifications,
-            "pref_quali": self.preferred_qualifications,
-            "link": self.link,
-            "company": self.company,
-            "location": self.location,
-            "division": self.division,
-            "position": self.position
-        }
-
 
 class GoogleJobScraper(JobScraper):
+    listing_class = GoogleJobListing
+
+    # Longest qualifications summary shown in a notification.
+    SUMMARY_LENGTH = 200
+
     def __init__(self):
         super().__init__(company_name="Google")
+        # Qualifications are only parsed by load_details(), for NEW listings, from the job
+        # cards of this run. They are not part of the saved state, so rewording one no
+        # longer reports the job as updated.
+        self._cards: Dict[str, Any] = {}
         self.url = "https://www.google.com/about/careers/applications/jobs/results?location=Switzerland&"
         self.logo_path = "lib/google.png"
 
+    # Cheap check for "this page still has results", so every page can be fetched and
+    # compared with the previous run before any of them is handed to BeautifulSoup.
+    JOB_CARD = re.compile(r'class="[^"]*\bLn1EL\b')
+
     def scrape(self) -> List[GoogleJobListing]:
-        # Your scraping logic
-        
+        pages = []
         i = 1
-        while(True):
-            response = requests.get(self.url+"page="+str(i))
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                divs = soup.find_all('div', class_='Ln1EL')
-                if len(divs)>0:
-                    self.current_listings.extend([self.extract_description(div) for div in divs])
-                    i+=1
-                else:
-                    break
-            else:
-                logging.error("Could not scrape Google")
-                
+        while True:
+            response = self.fetch("GET", self.url + "page=" + str(i))
+            if response.status_code != 200:
+                # A missing page would show up as delistings; skip the whole run instead.
+                logging.error(f"Could not scrape Google (status={response.status_code}, page={i})")
+                return self.current_listings
+            if not self.JOB_CARD.search(response.text):
+                break
+            pages.append(response.content)
+            i += 1
+
+        if self.not_modified:
+            return self.current_listings
+
+        for content in pages:
+            soup = BeautifulSoup(content, 'html.parser')
+            divs = soup.find_all('div', class_='Ln1EL')
+            for div in divs:
+                listing = self.extract_description(div)
+                self._cards[listing.get_id()] = div
+                self.current_listings.append(listing)
+
         return self.current_listings
 
     def extract_description(self, element: Any) -> GoogleJobListing:
@@ -65,8 +70,7 @@ class GoogleJobScraper(JobScraper):
         link = "https://www.google.com/about/careers/applications/"+element.find('a', class_='WpHeLc')['href']
         listing_id = re.search(r'jobs/results/(\d+)-', link).group(1)
         title = element.find('h3', class_='QJPWVe').get_text()
-        min_quali = [li.get_text(strip=True) for li in element.find('h4', string='Minimum qualifications').find_next('ul').find_all('li')] 
-        
+
         div = element.find('div', class_='op1BBf')
 
 # Create a dictionary to store the results
@@ -102,13 +106,24 @@ class GoogleJobScraper(JobScraper):
                     if next_span:
                         result[label] = next_span.text.strip()
 
-        
-        pref_quali = []
-        pref_qual_section = element.find('h4', string='Preferred qualifications')
-        if pref_qual_section:
-            pref_quali = [li.get_text(strip=True) for li in pref_qual_section.find_next('ul').find_all('li')]
+        return GoogleJobListing(listing_id, title, link, result.get("Location", ""), result.get("Company", ""), result.get("Position", ""))
 
-        return GoogleJobListing(listing_id, title, min_quali, pref_quali, link, result.get("Location", ""), result.get("Company", ""), result.get("Position", ""))
+    def load_details(self, listings: List[GoogleJobListing]) -> None:
+        for listing in listings:
+            card = self._cards.get(listing.get_id())
+            if card is None:
+                continue
+            details = self.extract_qualifications(card)
+            summary = "; ".join(details["min_quali"])
+            if len(summary) > self.SUMMARY_LENGTH:
+                summary = summary[:self.SUMMARY_LENGTH - 1].rstrip() + "…"
+            details["summary"] = summary
+            listing.details = details
 
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> GoogleJobListing:
-        return GoogleJobListing(data["id"], data["title"], data["min_quali"], data["pref_quali"], data["link"], data["location"], data["division"], data["position"])
+    @staticmethod
+    def extract_qualifications(element: Any) -> Dict[str, List[str]]:
+        qualifications = {}
+        for key, heading in (("min_quali", "Minimum qualifications"), ("pref_quali", "Preferred qualifications")):
+            section = element.find('h4', string=heading)
+            qualifications[key] = [li.get_text(strip=True) for li in section.find_next('ul').find_all('li')] if section else []
+        return qualifications
@@ -0,0 +1,204 @@
+from lib.base_joblisting import JobListing
+from lib.base_scraper import JobScraper
+from lib import http_client
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+import threading
+import weakref
+import logging
+
+
+class GreenhouseJobListing(JobListing):
+    __slots__ = ("id", "title", "location", "department", "link")
+
+    def __init__(self, listing_id: str, title: str, location: str, department: str, link: str):
+        self.id = listing_id
+        self.title = title
+        self.location = location
+        self.department = department
+        self.link = link
+
+
+def _job_ids(group: Dict[str, Any]) -> Iterator[str]:
+    """Ids of the jobs in an office/department and everything nested below it."""
+    for job in group.get("jobs", []):
+        yield str(job.get("id"))
+    for child in group.get("departments", []) + group.get("children", []):
+        yield from _job_ids(child)
+
+
+class GreenhouseJobScraper(JobScraper):
+    """Scraper for any board on the public Greenhouse job board API.
+
+    A board is fully described by its token and a location (optionally department)
+    filter, so adding one is a single line:
+
+        GreenhouseJobScraper("Acme", "acme", locations=("Zurich",))
+
+    Location terms are matched as substrings of the posting's location name. Boards whose
+    Swiss postings need more than that (office lists, custom links) override
+    `_matches` / `_make_listing`.
+
+    Large global boards pass `streaming=True`: they are then fetched on their own rather
+    than in the shared batch, and filtered job by job while the response streams in.
+
+    The jobs endpoint is always requested without `?content=true`, which would inline
+    every posting's HTML. Boards that filter on offices or departments list them in
+    `fields`; those are read from the small /offices and /departments endpoints and merged
+    into each job in the shape content=true would have given.
+    """
+
+    listing_class = GreenhouseJobListing
+
+    BOARD_URL = "https://boards-api.greenhouse.io/v1/boards/{board}"
+    PROJECTIONS = ("offices", "departments")
+
+    # Instances created this run whose board hasn't been fetched yet. The first Greenhouse
+    # scraper to run fetches all of them at once over the shared connection pool, so the
+    # boards cost one concurrent round trip instead of one each. Weak, so a scraper that
+    # was created but dropped (e.g. filtered out by test_scrapers) is not fetched.
+    _pending = weakref.WeakSet()
+    _pending_lock = threading.Lock()
+
+    def __init__(self, company_name: str, board: str, locations: Iterable[str] = (),
+                 departments: Iterable[str] = (), logo_path: str = None,
+                 fields: Iterable[str] = (), headers: Dict[str, str] = None, streaming: bool = False):
+        super().__init__(company_name=company_name)
+        self.board = board
+        self.locations = tuple(locations)
+        self.departments = tuple(departments)
+        self.logo_path = logo_path or f"lib/{board}.png"
+        self.board_url = self.BOARD_URL.format(board=board)
+        self.api_url = f"{self.board_url}/jobs"
+        self.fields = tuple(fields)
+        unknown = set(self.fields) - set(self.PROJECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown Greenhouse fields: {sorted(unknown)}")
+        self.headers = headers or {}
+        self.streaming = streaming
+
+        self._response = None
+        self._projection: Optional[Dict[str, Dict[str, List[Dict[str, Any]]]]] = None
+        self._error = None
+        self._fetched = threading.Event()
+        if not streaming:
+            with GreenhouseJobScraper._pending_lock:
+                GreenhouseJobScraper._pending.add(self)
+
+    def _fetch_board(self) -> None:
+        try:
+            self._response = self.conditional_get(self.api_url, headers=self.headers)
+            if self._response.status_code == 200:
+                self._projection = self._fetch_projection()
+        except Exception as e:
+            self._error = e
+        finally:
+            self._fetched.set()
+
+    def _fetch_boards(self) -> None:
+        """Fetch this board together with every other Greenhouse board still pending."""
+        with GreenhouseJobScraper._pending_lock:
+            batch = list(GreenhouseJobScraper._pending)
+            GreenhouseJobScraper._pending.clear()
+        if batch:
+            http_client.fetch_all(GreenhouseJobScraper._fetch_board, batch)
+        # Another scraper may have picked this board up in its batch.
+        self._fetched.wait()
+        if self._error is not None:
+            raise self._error
+
+    def _fetch_projection(self) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """job id -> {field: [{"id", "name"}, ...]} for every field in `fields`.
+
+        Not conditional: it is only needed when the jobs themselves changed, and then
+        it has to be complete.
+        """
+        projection: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        for field in self.fields:
+            response = http_client.get(f"{self.board_url}/{field}", headers=self.headers,
+                                       params={"render_as": "list"})
+            response.raise_for_status()
+            for group in response.json().get(field, []):
+                entry = {"id": group.get("id"), "name": group.get("name", "")}
+                for job_id in _job_ids(group):
+                    entries = projection.setdefault(job_id, {}).setdefault(field, [])
+                    if entry not in entries:
+                        entries.append(entry)
+        return projection
+
+    def _project(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        if not self.fields:
+            return job
+        if self._projection is None:
+            self._projection = self._fetch_projection()
+        fields = self._projection.get(str(job.get("id")), {})
+        for field in self.fields:
+            job[field] = fields.get(field, [])
+        return job
+
+    @staticmethod
+    def _location(job: Dict[str, Any]) -> str:
+        return job.get('location', {}).get('name', '')
+
+    @staticmethod
+    def _department(job: Dict[str, Any]) -> str:
+        departments = job.get('departments', [])
+        return departments[0]['name'] if departments else ''
+
+    def _matches(self, job: Dict[str, Any]) -> bool:
+        if self.locations and not any(term in self._location(job) for term in self.locations):
+            return False
+        if self.departments and self._department(job) not in self.departments:
+            return False
+        return True
+
+    def _make_listing(self, job: Dict[str, Any]) -> JobListing:
+        return GreenhouseJobListing(
+            listing_id=str(job.get('id', '')),
+            title=job.get('title', ''),
+            location=self._location(job),
+            department=self._department(job),
+            link=job.get('absolute_url', '')
+        )
+
+    def _scrape_streaming(self) -> List[JobListing]:
+        listings = []
+        try:
+            for job in self.stream_items(self.api_url, "jobs", conditional=True, headers=self.headers):
+                if self._matches(self._project(job)):
+                    listings.append(self._make_listing(job))
+        except Exception as e:
+            # A stream cut off half-way must not look like a shorter board.
+            logging.error(f"Error scraping {self.company} jobs: {e}")
+            return []
+
+        if self.not_modified:
+            return []
+        self.current_listings = listings
+        return listings
+
+    def scrape(self) -> List[JobListing]:
+        if self.streaming:
+            return self._scrape_streaming()
+
+        listings = []
+
+        try:
+            self._fetch_boards()
+            if self.not_modified:
+                return listings
+
+            response = self._response
+            if response.status_code != 200:
+                logging.error(f"{self.company} Greenhouse API returned {response.status_code}")
+                return listings
+
+            for job in response.json().get('jobs', []):
+                if self._matches(self._project(job)):
+                    listings.append(self._make_listing(job))
+
+            self.current_listings = listings
+
+        except Exception as e:
+            logging.error(f"Error scraping {self.company} jobs: {e}")
+
+        return listings
@@ -0,0 +1,78 @@
+import hashlib
+import logging
+import os
+import threading
+from typing import Any, Dict
+
+import requests
+
+from lib import codec, durable
+
+
+class ValidatorCache:
+    """On-disk store of HTTP validators (ETag / Last-Modified) and body hashes for one company.
+
+    Validators from this run are only staged; commit() writes them once the run has been
+    fully processed. If a scrape fails half-way, the next run therefore revalidates
+    against the last state that was actually saved, not against a response we never used.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = self._load()
+        self.staged: Dict[str, Dict[str, Any]] = {}
+        self.lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            return codec.read(self.path)
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable HTTP cache {self.path}: {e}")
+            return {}
+
+    @staticmethod
+    def key(method: str, url: str, params: Any = None, data: Any = None, json: Any = None) -> str:
+        prepared = requests.Request(method, url, params=params, data=data, json=json).prepare()
+        key = f"{method} {prepared.url}"
+        if prepared.body:
+            body = prepared.body if isinstance(prepared.body, bytes) else prepared.body.encode()
+            key += " " + hashlib.sha1(body).hexdigest()
+        return key
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        entry = self.entries.get(key, {})
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def stage(self, key: str, response: requests.Response, digest: str = None) -> bool:
+        """Remember the response's validators and body hash; True if the body is unchanged.
+
+        Streamed responses pass the `digest` they computed while reading, since their
+        content is gone by then.
+        """
+        if digest is None:
+            digest = hashlib.sha1(response.content).hexdigest()
+        entry = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "sha1": digest,
+        }
+        with self.lock:
+            self.staged[key] = entry
+            return self.entries.get(key, {}).get("sha1") == digest
+
+    def commit(self) -> None:
+        with self.lock:
+            if not self.staged:
+                return
+            self.entries.update(self.staged)
+            self.staged = {}
+            entries = dict(self.entries)
+
+        durable.write_json(self.path, entries)
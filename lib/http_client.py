@@ -0,0 +1,97 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from lib import codec
+from lib.rate_limiter import limiter
+
+# Applied to every request that does not pass its own timeout. Without it a stalled
+# server would block a worker forever.
+DEFAULT_TIMEOUT = 20
+
+# Most requests one scraper keeps in flight for its remaining pages. The per-host limiter
+# still decides how fast they actually go out.
+MAX_PAGE_WORKERS = 8
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class CodecResponse(requests.Response):
+    """Response whose json() parses the raw bytes with lib.codec instead of the stdlib."""
+
+    def json(self, **kwargs):
+        if kwargs:
+            return super().json(**kwargs)
+        try:
+            return codec.loads(self.content)
+        except ValueError:
+            # Let requests raise its usual JSONDecodeError so callers' handling is unchanged.
+            return super().json()
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter that keeps connections alive per host, applies the shared per-host
+    rate limit and falls back to DEFAULT_TIMEOUT."""
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        limiter.wait(request.url)
+        return super().send(request, timeout=self.timeout if timeout is None else timeout, **kwargs)
+
+    def build_response(self, req, resp):
+        response = super().build_response(req, resp)
+        response.__class__ = CodecResponse
+        return response
+
+
+# One adapter (and so one urllib3 pool manager) for the whole process: every session
+# mounts it, so a paginated scraper reuses the same TCP+TLS connection page after page.
+# pool_connections is the number of hosts kept warm, pool_maxsize the connections per host.
+_adapter = PooledAdapter(pool_connections=64, pool_maxsize=16)
+
+
+def new_session() -> requests.Session:
+    """A session with its own cookies and headers that shares the process-wide pool.
+
+    Use this for scrapers that need a cookie/CSRF handshake; stateless calls can go
+    through get()/post() directly.
+    """
+    session = requests.Session()
+    session.mount("https://", _adapter)
+    session.mount("http://", _adapter)
+    return session
+
+
+_session = new_session()
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    return _session.request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return _session.get(url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return _session.post(url, **kwargs)
+
+
+def fetch_all(fetch: Callable[[T], R], items: Iterable[T], max_workers: int = MAX_PAGE_WORKERS) -> List[R]:
+    """Call fetch(item) for every item concurrently and return the results in item order.
+
+    Meant for the pages of a paginated API once the first page has told us how many there
+    are: the rest then cost about one round trip instead of one per page. The workers
+    share the keep-alive pool, so no extra handshakes are paid.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [fetch(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(fetch, items))
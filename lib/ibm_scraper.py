@@ -1,33 +1,25 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
-import requests
+from lib import http_client
+from typing import List
 import logging
 
 
 class IBMJobListing(JobListing):
+    __slots__ = ("id", "title", "category", "work_type", "link")
+    company = "IBM"
+
     def __init__(self, listing_id: str, title: str, category: str, work_type: str, link: str):
         self.id = listing_id
         self.title = title
         self.category = category
         self.work_type = work_type
         self.link = link
-        self.company = "IBM"
-
-    def get_id(self) -> str:
-        return self.id
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "category": self.category,
-            "work_type": self.work_type,
-            "link": self.link
-        }
 
 
 class IBMJobScraper(JobScraper):
+    listing_class = IBMJobListing
+
     def __init__(self):
         super().__init__(company_name="IBM")
         self.api_url = "https://www-api.ibm.com/search/api/v2"
@@ -54,7 +46,7 @@ class IBMJobScraper(JobScraper):
         }
 
         try:
-            response = requests.post(self.api_url, headers=headers, json=json_data)
+            response = http_client.post(self.api_url, headers=headers, json=json_data)
 
             if response.status_code != 200:
                 logging.error(f"IBM API returned {response.status_code}")
@@ -100,13 +92,3 @@ class IBMJobScraper(JobScraper):
             logging.error(f"Error scraping IBM jobs: {e}")
 
         return listings
-
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> IBMJobListing:
-        """Convert a dictionary back into an IBMJobListing object."""
-        return IBMJobListing(
-            listing_id=data["id"],
-            title=data["title"],
-            category=data["category"],
-            work_type=data["work_type"],
-            link=data["link"]
-        )
\ No newline at end of file
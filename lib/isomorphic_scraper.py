@@ -1,86 +1,21 @@
-from lib.base_joblisting import JobListing
-from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
-import requests
-import logging
+from lib.greenhouse import GreenhouseJobScraper
+from typing import Dict, Any
 
 
-class IsomorphicJobListing(JobListing):
-    def __init__(self, listing_id: str, title: str, location: str, department: str, link: str):
-        self.id = listing_id
-        self.title = title
-        self.location = location
-        self.department = department
-        self.link = link
-        self.company = "Isomorphic Labs"
-
-    def get_id(self) -> str:
-        return self.id
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "location": self.location,
-            "department": self.department,
-            "link": self.link
-        }
-
-
-class IsomorphicJobScraper(JobScraper):
+class IsomorphicJobScraper(GreenhouseJobScraper):
     # Isomorphic Labs (DeepMind drug-discovery spin-off) has a Lausanne office.
     CH_CITIES = ("zurich", "zürich", "geneva", "genève", "genf", "zug", "basel",
                  "bern", "lausanne", "baar", "lugano", "winterthur", "switzerland", "suisse")
 
     def __init__(self):
-        super().__init__(company_name="Isomorphic Labs")
-        self.api_url = "https://boards-api.greenhouse.io/v1/boards/isomorphiclabs/jobs?content=true"
-        self.logo_path = "lib/isomorphic.png"
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36',
-        }
-
-    def _is_swiss(self, job: Dict[str, Any]) -> bool:
-        blob = job.get("location", {}).get("name", "").lower()
+        super().__init__(
+            "Isomorphic Labs", "isomorphiclabs", logo_path="lib/isomorphic.png",
+            fields=("offices", "departments"),
+            headers={
+                'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36',
+            })
+
+    def _matches(self, job: Dict[str, Any]) -> bool:
+        blob = self._location(job).lower()
         blob += " " + " ".join(o.get("name", "") for o in job.get("offices", [])).lower()
         return any(city in blob for city in self.CH_CITIES)
-
-    def scrape(self) -> List[IsomorphicJobListing]:
-        listings = []
-
-        try:
-            response = requests.get(self.api_url, headers=self.headers, timeout=20)
-            if response.status_code != 200:
-                logging.error(f"Isomorphic Labs Greenhouse API returned {response.status_code}")
-                return listings
-
-            for job in response.json().get('jobs', []):
-                if not self._is_swiss(job):
-                    continue
-
-                departments = job.get('departments', [])
-                department = departments[0]['name'] if departments else ''
-
-                listings.append(IsomorphicJobListing(
-                    listing_id=str(job.get('id', '')),
-                    title=job.get('title', ''),
-                    location=job.get('location', {}).get('name', ''),
-                    department=department,
-                    link=job.get('absolute_url', '')
-                ))
-
-            self.current_listings = listings
-            return listings
-
-        except Exception as e:
-            logging.error(f"Error scraping Isomorphic Labs jobs: {e}")
-            return []
-
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> IsomorphicJobListing:
-        return IsomorphicJobListing(
-            listing_id=data["id"],
-            title=data["title"],
-            location=data["location"],
-            department=data["department"],
-            link=data["link"]
-        )
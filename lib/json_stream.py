@@ -0,0 +1,134 @@
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, Optional
+
+# ijson parses with a C backend when it is installed; the fallback below needs nothing
+# but the stdlib and keeps at most one chunk plus one array element in memory.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_WHITESPACE = re.compile(r"\s*")
+_decoder = json.JSONDecoder()
+
+
+class _ChunkReader:
+    """File-like view of an iterable of byte chunks, for ijson."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+class _TextStream:
+    """UTF-8 text of a chunk stream, consumed one JSON token or value at a time."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+        self._pos = 0
+        self._eof = False
+
+    def _more(self) -> bool:
+        if self._eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            text = self._utf8.decode(b"", final=True)
+        else:
+            text = self._utf8.decode(chunk)
+        # Drop what has been consumed so the buffer never holds more than one value.
+        self._text = self._text[self._pos:] + text
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """The next non-whitespace character, or '' at the end of the stream."""
+        while True:
+            self._pos = _WHITESPACE.match(self._text, self._pos).end()
+            if self._pos < len(self._text):
+                return self._text[self._pos]
+            if not self._more():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} in JSON stream, got {char!r}")
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._text, self._pos)
+            except ValueError:
+                if not self._more():
+                    raise
+                continue
+            # A value ending exactly at the buffer end may be a number cut off mid-way.
+            if end == len(self._text) and self._more():
+                continue
+            self._pos = end
+            return value
+
+
+def _array(text: _TextStream) -> Iterator[Any]:
+    text.expect("[")
+    if text.peek() == "]":
+        return
+    while True:
+        yield text.value()
+        if text.expect(",]") == "]":
+            return
+
+
+def _fallback_items(chunks: Iterable[bytes], key: Optional[str]) -> Iterator[Any]:
+    text = _TextStream(chunks)
+    if key is None:
+        yield from _array(text)
+        return
+    text.expect("{")
+    if text.peek() == "}":
+        return
+    while True:
+        name = text.value()
+        text.expect(":")
+        if name == key:
+            yield from _array(text)
+            return
+        text.value()
+        if text.expect(",}") == "}":
+            return
+
+
+def items(chunks: Iterable[bytes], key: Optional[str] = None) -> Iterator[Any]:
+    """Yield the elements of a JSON array one at a time while the bytes arrive.
+
+    With `key` the array is the value of that top-level key (`{"jobs": [...]}`); without
+    it the document itself is the array. A missing key yields nothing. Only the current
+    element is ever held in memory, so a board that is filtered as it streams costs the
+    same memory however large it is.
+    """
+    if ijson is not None:
+        yield from ijson.items(_ChunkReader(chunks), f"{key}.item" if key else "item", use_float=True)
+    else:
+        yield from _fallback_items(chunks, key)
@@ -1,55 +1,62 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
+from typing import List, Any
 from bs4 import BeautifulSoup
-import requests
 import logging
 import re
+from html import unescape
 
 
 class LGTJobListing(JobListing):
+    __slots__ = ("id", "title", "link", "locations", "division", "position", "workload")
+    FIELDS = ("id", "title", "link", "company", "locations", "division", "position", "workload")
+    company = "LGT"
+
     def __init__(self, listing_id: str, title: str, link: str, locations: List[str], division: str, position: str, workload: str):
         self.id = listing_id
         self.title = title
         self.link = link
-        self.company = "LGT"
         self.locations = locations
         self.division = division
         self.position = position
         self.workload = workload
 
-    def get_id(self) -> str:
-        return self.id
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "link": self.link,
-            "company": self.company,
-            "locations": self.locations,
-            "division": self.division,
-            "position": self.position,
-            "workload": self.workload,
-        }
-
 
 class LGTJobScraper(JobScraper):
+    listing_class = LGTJobListing
+
     def __init__(self):
         super().__init__(company_name="LGT")
         self.base_url = "https://www.lgt.com"
         self.start_url = "https://www.lgt.com/global-en/career/jobs/34662!jobSearch?q=&location=12412,287504&interests=12380,70290"
         self.logo_path = "lib/lgt.png"
 
+    # Pagination is followed with a regex so all pages can be fetched (and compared with
+    # the previous run) before any of them is handed to BeautifulSoup.
+    NEXT_PAGE = re.compile(r'lgt-pagination__next[^>]*>(.*?)</li>', re.DOTALL)
+    HREF = re.compile(r'href="([^"]+)"')
+
+    def _next_page_url(self, html: str) -> str:
+        next_li = self.NEXT_PAGE.search(html)
+        href = self.HREF.search(next_li.group(1)) if next_li else None
+        return self.base_url + unescape(href.group(1)) if href else None
+
     def scrape(self) -> List[LGTJobListing]:
+        pages = []
         page_url = self.start_url
-        while True:
-            response = requests.get(page_url)
+        while page_url:
+            response = self.fetch("GET", page_url)
             if response.status_code != 200:
                 logging.error(f"Could not scrape LGT (status={response.status_code}, url={page_url})")
                 break
+            pages.append(response.content)
+            page_url = self._next_page_url(response.text)
+
+        if self.not_modified:
+            return self.current_listings
 
-            soup = BeautifulSoup(response.content, "html.parser")
+        for content in pages:
+            soup = BeautifulSoup(content, "html.parser")
 
             # --- Get all job blocks ---
             job_divs = soup.find_all("div", class_="lgt-teaser-list__element")
@@ -58,18 +65,6 @@ class LGTJobScraper(JobScraper):
                 if job:
                     self.current_listings.append(job)
 
-            # --- Handle pagination ---
-            pagination_nav = soup.find("nav", class_="lgt-pagination")
-            if pagination_nav:
-                next_btn = pagination_nav.find("li", class_="lgt-pagination__next")
-                if next_btn and next_btn.find("a"):
-                    next_href = next_btn.find("a")["href"]
-                    page_url = self.base_url + next_href
-                else:
-                    break  # no more next link
-            else:
-                break  # no pagination
-
         return self.current_listings
 
     def extract_description(self, element: Any) -> LGTJobListing:
@@ -94,14 +89,3 @@ class LGTJobScraper(JobScraper):
         workload = interest_items[2] if len(interest_items) > 2 else ""
 
         return LGTJobListing(listing_id, title, link, locations, division, position, workload)
-
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> LGTJobListing:
-        return LGTJobListing(
-            data["id"],
-            data["title"],
-            data["link"],
-            data["locations"],
-            data["division"],
-            data["position"],
-            data["workload"],
-        )
@@ -1,12 +1,12 @@
 from lib.base_joblisting import JobListing
-from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
-import requests
-import logging
+from lib.workday import WorkdayJobScraper
+from typing import Dict, Any
 import re
 
 
 class LGTCPJobListing(JobListing):
+    __slots__ = ("id", "title", "locations", "link", "location_from_link")
+
     def __init__(self, listing_id: str, title: str, locations: str, link: str):
         self.id = listing_id
         self.title = title
@@ -19,75 +19,24 @@ class LGTCPJobListing(JobListing):
         match = re.search(r'/job/([^/]+)/', url)
         return match.group(1).replace('-', ' ') if match else None
 
-    def get_id(self) -> str:
-        return self.id
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "locations": self.locations,
-            "link": self.link,
-            "location_from_link": self.location_from_link,
-        }
 
+class LGTCPJobScraper(WorkdayJobScraper):
+    listing_class = LGTCPJobListing
 
-class LGTCPJobScraper(JobScraper):
     def __init__(self):
-        super().__init__(company_name="LGTCP")
-        self.logo_path = "lib/LGTCP.jpg"
-        self.url = 'https://lgtcp.wd502.myworkdayjobs.com/wday/cxs/lgtcp/lgtcpcurrentvacancies/jobs'
-        self.json_data = {
-            'appliedFacets': {
+        super().__init__(
+            "LGTCP", "lgtcp.wd502.myworkdayjobs.com", "lgtcp", "lgtcpcurrentvacancies",
+            {
                 # Pfäffikon, Switzerland
                 'locations': ['8e79cea3a59c01011b74930a4f6f0000'],
             },
-            'limit': 20,
-            'offset': 0,
-            'searchText': '',
-        }
-
-    def scrape(self) -> List[LGTCPJobListing]:
-        all_jobs = []
-        total_jobs = None
-        offset = 0
-        limit = self.json_data['limit']
-
-        while total_jobs is None or offset < total_jobs:
-            self.json_data['offset'] = offset
-
-            try:
-                response = requests.post(self.url, json=self.json_data)
-                response.raise_for_status()
-                data = response.json()
-            except Exception as e:
-                logging.error(f"LGTCP scrape failed at offset {offset}: {e}")
-                break
-
-            if total_jobs is None:
-                total_jobs = data.get('total', 0)
-
-            jobs = data.get('jobPostings', [])
-            for job in jobs:
-                if not job.get('title') or not job.get('externalPath'):
-                    continue
-                job_id = job.get('bulletFields', [None])[0]
-                job_slug = job.get('externalPath').split('/')[-1]
-                job_url = f"https://lgtcp.wd502.myworkdayjobs.com/en-US/lgtcpcurrentvacancies/details/{job_slug}"
-                all_jobs.append(
-                    LGTCPJobListing(
-                        listing_id=job_id,
-                        title=job.get('title'),
-                        locations=job.get('locationsText'),
-                        link=job_url
-                        )
-                    )
-            offset += limit
-
-        self.current_listings.extend(all_jobs)
-        return self.current_listings
+            logo_path="lib/LGTCP.jpg")
 
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> LGTCPJobListing:
+    def _make_listing(self, job: Dict[str, Any]) -> LGTCPJobListing:
+        job_slug = job.get('externalPath').split('/')[-1]
         return LGTCPJobListing(
-            data["id"], data["title"], data["locations"], data["link"]
+            listing_id=job.get('bulletFields', [None])[0],
+            title=job.get('title'),
+            locations=job.get('locationsText'),
+            link=f"https://{self.host}/en-US/{self.site}/details/{job_slug}"
         )
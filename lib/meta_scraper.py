@@ -1,26 +1,25 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
-import requests
-import logging
-import re
+from lib import http_client
+from typing import List
 
 class MetaJobListing(JobListing):
+    __slots__ = ("id", "title", "locations", "teams", "sub_teams")
+
     def __init__(self, listing_id: str, title:str, locations: list[str], teams: list[str], sub_teams: list[str]):
         self.id = listing_id
         self.title = title
         self.locations = locations
         self.teams = teams
         self.sub_teams = sub_teams
-        self.link = f"https://www.metacareers.com/jobs/{listing_id}/"
-        
-    def get_id(self):
-        return self.id
 
-    def to_dict(self):
-        return {"id": self.id, "title": self.title, "locations": self.locations, "teams": self.teams, "sub_teams": self.sub_teams}
+    @property
+    def link(self) -> str:
+        return f"https://www.metacareers.com/jobs/{self.id}/"
 
 class MetaJobScraper(JobScraper):
+    listing_class = MetaJobListing
+
     def __init__(self):
         super().__init__(company_name="Meta")
         self.url = "https://www.metacareers.com/graphql"
@@ -51,13 +50,10 @@ class MetaJobScraper(JobScraper):
         }
             
     def scrape(self) -> List[MetaJobListing]:
-        response = requests.post(self.url,  headers=self.headers, data=self.data)
+        response = http_client.post(self.url,  headers=self.headers, data=self.data)
         
         if response.status_code == 200:
             current_listings = [MetaJobListing(l["id"], l["title"], l["locations"], l["teams"], l["sub_teams"]) for l in response.json()["data"]["job_search"]]
             self.current_listings.extend(current_listings)
             return self.current_listings
         return []
-    
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> MetaJobListing:
-        return MetaJobListing(data["id"], data["title"], data["locations"], data["teams"], data["sub_teams"])
@@ -1,23 +1,20 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
-import requests
+from lib import http_client
 import logging
 
 class MicrosoftJobListing(JobListing):
+    __slots__ = ("id", "title", "profession", "link")
+
     def __init__(self, listing_id: str, title:str, department: str):
         self.id = listing_id
         self.title = title
         self.profession = department
         self.link = f"https://apply.careers.microsoft.com/careers/job/{listing_id}"
 
-    def get_id(self):
-        return self.id
-
-    def to_dict(self):
-        return {"id": self.id, "title": self.title, "profession": self.profession, "link": self.link}
-
 class MicrosoftJobScraper(JobScraper):
+    listing_class = MicrosoftJobListing
+
     def __init__(self):
         super().__init__(company_name="Microsoft")
         self.logo_path = "lib/microsoft.png"
@@ -40,7 +37,7 @@ class MicrosoftJobScraper(JobScraper):
         while True:
             self.params["start"] = str(start)
             try:
-                response = requests.get(self.url, params=self.params)
+                response = http_client.get(self.url, params=self.params)
                 response.raise_for_status()
                 positions = response.json()["data"]["positions"]
             except Exception as e:
@@ -60,6 +57,3 @@ class MicrosoftJobScraper(JobScraper):
             for a in all_jobs
         ])
         return self.current_listings
-
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> MicrosoftJobListing:
-        return MicrosoftJobListing(data["id"], data["title"], data["profession"])
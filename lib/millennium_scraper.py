@@ -1,11 +1,13 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
-import requests
+from lib import http_client
+from typing import List
 import logging
 
 
 class MillenniumJobListing(JobListing):
+    __slots__ = ("id", "title", "location", "department", "link")
+
     def __init__(self, listing_id: str, title: str, location: str, department: str, link: str):
         self.id = listing_id
         self.title = title
@@ -13,20 +15,10 @@ class MillenniumJobListing(JobListing):
         self.department = department
         self.link = link
 
-    def get_id(self) -> str:
-        return self.id
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "location": self.location,
-            "department": self.department,
-            "link": self.link
-        }
-
 
 class MillenniumJobScraper(JobScraper):
+    listing_class = MillenniumJobListing
+
     def __init__(self):
         super().__init__(company_name="Millennium")
         self.logo_path = "lib/millennium.png"
@@ -52,7 +44,7 @@ class MillenniumJobScraper(JobScraper):
                     'sort_by': 'relevance'
                 }
 
-                response = requests.get(self.api_url, params=params, headers=self.headers, timeout=10)
+                response = http_client.get(self.api_url, params=params, headers=self.headers, timeout=10)
                 if response.status_code != 200:
                     logging.error(f"Millennium API returned {response.status_code}")
                     break
@@ -82,12 +74,3 @@ class MillenniumJobScraper(JobScraper):
             logging.error(f"Error scraping Millennium jobs: {e}")
 
         return listings
-
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> MillenniumJobListing:
-        return MillenniumJobListing(
-            listing_id=data["id"],
-            title=data["title"],
-            location=data["location"],
-            department=data["department"],
-            link=data["link"]
-        )
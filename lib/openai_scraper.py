@@ -1,88 +1,20 @@
-from lib.base_joblisting import JobListing
-from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
-import requests
-import logging
+from lib.public_ats import AshbyJobScraper, PostingJobListing
 
 
-class OpenAIJobListing(JobListing):
-    def __init__(self, listing_id: str, title: str, location: str, department: str, link: str):
-        self.id = listing_id
-        self.title = title
-        self.location = location
-        self.department = department
-        self.link = link
-        self.company = "OpenAI"
+class OpenAIJobListing(PostingJobListing):
+    __slots__ = ()
+    company = "OpenAI"
 
-    def get_id(self) -> str:
-        return self.id
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "location": self.location,
-            "department": self.department,
-            "link": self.link
-        }
+class OpenAIJobScraper(AshbyJobScraper):
+    listing_class = OpenAIJobListing
 
-
-class OpenAIJobScraper(JobScraper):
     # OpenAI has a Zurich office; keep any posting whose primary or secondary
     # location is in Switzerland.
-    CH_CITIES = ("zurich", "zürich", "geneva", "genève", "genf", "zug", "basel",
-                 "bern", "lausanne", "baar", "pfäffikon", "pfaffikon", "lugano",
-                 "winterthur", "switzerland", "suisse")
-
     def __init__(self):
-        super().__init__(company_name="OpenAI")
-        self.api_url = "https://api.ashbyhq.com/posting-api/job-board/openai?includeCompensation=false"
-        self.logo_path = "lib/openai.png"
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36',
-        }
-
-    def _is_swiss(self, job: Dict[str, Any]) -> bool:
-        locations = [job.get("location", "")]
-        locations += [s.get("location", "") for s in (job.get("secondaryLocations") or [])]
-        blob = " ".join(locations).lower()
-        return any(city in blob for city in self.CH_CITIES)
-
-    def scrape(self) -> List[OpenAIJobListing]:
-        listings = []
-
-        try:
-            response = requests.get(self.api_url, headers=self.headers, timeout=20)
-            if response.status_code != 200:
-                logging.error(f"OpenAI Ashby API returned {response.status_code}")
-                return listings
-
-            jobs = response.json().get('jobs', [])
-
-            for job in jobs:
-                if not self._is_swiss(job):
-                    continue
-
-                listings.append(OpenAIJobListing(
-                    listing_id=str(job.get('id', '')),
-                    title=job.get('title', ''),
-                    location=job.get('location', ''),
-                    department=job.get('department', ''),
-                    link=job.get('jobUrl', '')
-                ))
-
-            self.current_listings = listings
-
-        except Exception as e:
-            logging.error(f"Error scraping OpenAI jobs: {e}")
-
-        return listings
-
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> OpenAIJobListing:
-        return OpenAIJobListing(
-            listing_id=data["id"],
-            title=data["title"],
-            location=data["location"],
-            department=data["department"],
-            link=data["link"]
+        super().__init__(
+            "OpenAI", "openai", logo_path="lib/openai.png",
+            headers={
+                'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36',
+            }
         )
@@ -1,33 +1,25 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
-import requests
+from lib import http_client
+from typing import List
 import logging
 
 
 class OracleJobListing(JobListing):
+    __slots__ = ("id", "title", "location", "posted_date", "link")
+    company = "Oracle"
+
     def __init__(self, listing_id: str, title: str, location: str, posted_date: str, link: str):
         self.id = listing_id
         self.title = title
         self.location = location
         self.posted_date = posted_date
         self.link = link
-        self.company = "Oracle"
-
-    def get_id(self) -> str:
-        return self.id
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "location": self.location,
-            "posted_date": self.posted_date,
-            "link": self.link
-        }
 
 
 class OracleJobScraper(JobScraper):
+    listing_class = OracleJobListing
+
     def __init__(self):
         super().__init__(company_name="Oracle")
         self.api_url = "https://eeho.fa.us2.oraclecloud.com/hcmRestApi/resources/latest/recruitingCEJobRequisitions"
@@ -52,7 +44,7 @@ class OracleJobScraper(JobScraper):
         }
 
         try:
-            response = requests.get(self.api_url, headers=headers, params=params)
+            response = http_client.get(self.api_url, headers=headers, params=params)
 
             if response.status_code != 200:
                 logging.error(f"Oracle API returned {response.status_code}")
@@ -104,13 +96,3 @@ class OracleJobScraper(JobScraper):
             logging.error(f"Error scraping Oracle jobs: {e}")
 
         return listings
-
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> OracleJobListing:
-        """Convert a dictionary back into an OracleJobListing object."""
-        return OracleJobListing(
-            listing_id=data["id"],
-            title=data["title"],
-            location=data["location"],
-            posted_date=data["posted_date"],
-            link=data["link"]
-        )
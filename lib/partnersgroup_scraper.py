@@ -1,30 +1,20 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
+from lib import http_client
 from typing import List, Dict, Any
-import requests
 import logging
 
 
 class PartnersGroupJobListing(JobListing):
+    __slots__ = ("id", "title", "location", "department", "link")
+    company = "Partners Group"
+
     def __init__(self, listing_id: str, title: str, location: str, department: str, link: str):
         self.id = listing_id
         self.title = title
         self.location = location
         self.department = department
         self.link = link
-        self.company = "Partners Group"
-
-    def get_id(self) -> str:
-        return self.id
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "location": self.location,
-            "department": self.department,
-            "link": self.link
-        }
 
 
 class PartnersGroupJobScraper(JobScraper):
@@ -34,6 +24,8 @@ class PartnersGroupJobScraper(JobScraper):
     (technology / investments / capital markets / quant & risk), plus quant/trading titles.
     """
 
+    listing_class = PartnersGroupJobListing
+
     API_URL = "https://idxatsportal-prod-api.connectid.cloud/api/clients/67/jobs"
     # Public API token embedded in https://www.partnersgroup.com/en/javascripts/shared/jobs-ats.js
     API_TOKEN = ("56f067aa86809e1165da1621d1edbb9b6bcda4fc36b297be4fc1e5e1da4c2d230"
@@ -70,8 +62,8 @@ class PartnersGroupJobScraper(JobScraper):
         listings = []
 
         try:
-            resp = requests.post(self.API_URL, headers=self.headers,
-                                 json={"page": 1, "pageSize": 500}, timeout=20)
+            resp = http_client.post(self.API_URL, headers=self.headers,
+                                    json={"page": 1, "pageSize": 500}, timeout=20)
             if resp.status_code != 200:
                 logging.error(f"Partners Group API returned {resp.status_code}")
                 return listings
@@ -98,12 +90,3 @@ class PartnersGroupJobScraper(JobScraper):
         except Exception as e:
             logging.error(f"Error scraping Partners Group jobs: {e}")
             return []
-
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> PartnersGroupJobListing:
-        return PartnersGroupJobListing(
-            listing_id=data["id"],
-            title=data["title"],
-            location=data["location"],
-            department=data["department"],
-            link=data["link"]
-        )
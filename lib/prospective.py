@@ -0,0 +1,115 @@
+from lib.base_joblisting import JobListing
+from lib.base_scraper import JobScraper
+from lib import http_client
+from typing import List, Dict, Any, Tuple
+import logging
+
+
+class ProspectiveJobListing(JobListing):
+    __slots__ = ("id", "title", "location", "department", "link")
+
+    def __init__(self, listing_id: str, title: str, location: str, department: str, link: str):
+        self.id = listing_id
+        self.title = title
+        self.location = location
+        self.department = department
+        self.link = link
+
+
+class ProspectiveJobScraper(JobScraper):
+    """Scraper for a prospective.ch medium via `ohws.prospective.ch/public/v1/medium/<id>/jobs`.
+
+    `server_filters` are extra query parameters that narrow the catalogue on the server;
+    if the API rejects them the run falls back to the unfiltered catalogue. `_matches`
+    is always applied as well, so a filter the API silently ignores costs bandwidth but
+    never correctness. After each run `transfer_stats` records how many records and
+    (approximately) how many bytes were downloaded only to be discarded.
+    """
+
+    listing_class = ProspectiveJobListing
+
+    API_URL = "https://ohws.prospective.ch/public/v1/medium/{medium}/jobs"
+    PAGE_SIZE = 100
+
+    def __init__(self, company_name: str, medium: int, logo_path: str = None,
+                 headers: Dict[str, str] = None, server_filters: Dict[str, Any] = None,
+                 max_pages: int = None, lang: str = "de"):
+        super().__init__(company_name=company_name)
+        self.api_url = self.API_URL.format(medium=medium)
+        self.logo_path = logo_path
+        self.headers = headers or {}
+        self.server_filters = server_filters or {}
+        self.max_pages = max_pages
+        self.lang = lang
+        self.transfer_stats: Dict[str, int] = {}
+
+    def _get(self, offset: int, filters: Dict[str, Any]) -> Any:
+        params = dict(filters, lang=self.lang, offset=offset, limit=self.PAGE_SIZE)
+        return http_client.get(self.api_url, headers=self.headers, params=params)
+
+    def _fetch_page(self, offset: int, filters: Dict[str, Any]) -> Any:
+        response = self._get(offset, filters)
+        response.raise_for_status()
+        return response
+
+    def _fetch_first(self) -> Tuple[Any, Dict[str, Any]]:
+        """Page 1 and the filters the rest of the run uses."""
+        filters = self.server_filters
+        response = self._get(0, filters)
+        if filters and 400 <= response.status_code < 500:
+            logging.warning(f"{self.company} - server-side filter rejected ({response.status_code}), fetching everything")
+            filters = {}
+            response = self._get(0, filters)
+        response.raise_for_status()
+        return response, filters
+
+    def _matches(self, job: Dict[str, Any]) -> bool:
+        return True
+
+    def _make_listing(self, job: Dict[str, Any]) -> JobListing:
+        attrs = job.get("attributes", {})
+        return ProspectiveJobListing(
+            listing_id=str(job.get("id", "")),
+            title=job.get("title", ""),
+            location=", ".join(attrs.get("arbeitsort", [])),
+            department=", ".join(attrs.get("fachbereich", [])),
+            link=job.get("links", {}).get("directlink", "")
+        )
+
+    def scrape(self) -> List[JobListing]:
+        listings = []
+
+        try:
+            # The first page reports the total; the remaining pages are then fetched concurrently.
+            first, filters = self._fetch_first()
+            total = first.json().get("total", 0)
+            if self.max_pages is not None:
+                total = min(total, self.max_pages * self.PAGE_SIZE)
+            responses = [first] + http_client.fetch_all(
+                lambda offset: self._fetch_page(offset, filters), range(self.PAGE_SIZE, total, self.PAGE_SIZE))
+        except Exception as e:
+            # A missing page would show up as delistings; skip the whole run instead.
+            logging.error(f"Error scraping {self.company} jobs: {e}")
+            return listings
+
+        total_bytes = records = 0
+        for response in responses:
+            total_bytes += len(response.content)
+            for job in response.json().get("jobs", []):
+                records += 1
+                if self._matches(job):
+                    listings.append(self._make_listing(job))
+
+        discarded = records - len(listings)
+        self.transfer_stats = {
+            "records": records,
+            "records_discarded": discarded,
+            "bytes": total_bytes,
+            # Records are similar in size, so the discarded share of the bytes is a fair estimate.
+            "bytes_discarded": total_bytes * discarded // records if records else 0,
+        }
+        logging.info(f"{self.company} - kept {len(listings)} of {records} records, "
+                     f"~{self.transfer_stats['bytes_discarded'] // 1024} of {total_bytes // 1024} KiB discarded")
+
+        self.current_listings = listings
+        return listings
@@ -0,0 +1,242 @@
+from lib.base_joblisting import JobListing
+from lib.base_scraper import JobScraper
+from lib import http_client
+from typing import List, Dict, Any, Iterable, Iterator
+from abc import abstractmethod
+import logging
+
+# Substrings (lowercase) that mark a location as Swiss, for boards whose API cannot filter.
+CH_TERMS = ("zurich", "zürich", "geneva", "genève", "genf", "zug", "basel",
+            "bern", "lausanne", "baar", "pfäffikon", "pfaffikon", "lugano",
+            "winterthur", "switzerland", "suisse")
+
+
+class PostingJobListing(JobListing):
+    __slots__ = ("id", "title", "location", "department", "link")
+
+    def __init__(self, listing_id: str, title: str, location: str, department: str, link: str):
+        self.id = listing_id
+        self.title = title
+        self.location = location
+        self.department = department
+        self.link = link
+
+
+class SmartRecruitersJobListing(JobListing):
+    __slots__ = ("id", "title", "profession", "location", "link")
+
+    def __init__(self, listing_id: str, title: str, profession: str, location: str, link: str):
+        self.id = listing_id
+        self.title = title
+        self.profession = profession
+        self.location = location
+        self.link = link
+
+
+class RecruiteeJobListing(JobListing):
+    __slots__ = ("id", "title", "location", "posted_date", "link")
+
+    def __init__(self, listing_id: str, title: str, location: str, posted_date: str, link: str):
+        self.id = listing_id
+        self.title = title
+        self.location = location
+        self.posted_date = posted_date
+        self.link = link
+
+
+class PublicATSScraper(JobScraper):
+    """Base for boards on an applicant tracking system with a public, unauthenticated API.
+
+    Each vendor subclass implements `_jobs` (every posting the API returns, filtered on
+    the server as far as the vendor allows), `_locations` and `_make_listing`. Postings
+    are then kept if any of their locations contains one of `location_terms`; with no
+    terms, the server-side filter alone decides. The client-side check always runs, so a
+    filter the API silently ignores costs bandwidth but never correctness.
+
+    Every request goes through fetch()/stream_items(), so an unchanged board is reported
+    as `not_modified` and never parsed into listings. A failed request fails the whole
+    run rather than reporting a shorter board.
+    """
+
+    listing_class = PostingJobListing
+
+    def __init__(self, company_name: str, logo_path: str = None, location_terms: Iterable[str] = CH_TERMS,
+                 headers: Dict[str, str] = None):
+        super().__init__(company_name=company_name)
+        self.logo_path = logo_path
+        self.location_terms = tuple(term.lower() for term in location_terms)
+        self.headers = headers or {}
+
+    @abstractmethod
+    def _jobs(self) -> Iterator[Dict[str, Any]]:
+        """Every posting the API returns, after whatever filtering it does on the server."""
+
+    @abstractmethod
+    def _locations(self, job: Dict[str, Any]) -> List[str]:
+        """Every location of a posting, checked against `location_terms`."""
+
+    @abstractmethod
+    def _make_listing(self, job: Dict[str, Any]) -> JobListing:
+        """Build the listing for a kept posting."""
+
+    def _matches(self, job: Dict[str, Any]) -> bool:
+        if not self.location_terms:
+            return True
+        blob = " ".join(location or "" for location in self._locations(job)).lower()
+        return any(term in blob for term in self.location_terms)
+
+    def _get_json(self, url: str, **kwargs) -> Any:
+        response = self.fetch("GET", url, headers=self.headers, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    def scrape(self) -> List[JobListing]:
+        try:
+            listings = [self._make_listing(job) for job in self._jobs() if self._matches(job)]
+        except Exception as e:
+            # A stream or page cut off half-way must not look like a shorter board.
+            logging.error(f"Error scraping {self.company} jobs: {e}")
+            return []
+
+        if self.not_modified:
+            return []
+        self.current_listings = listings
+        return listings
+
+
+class LeverJobScraper(PublicATSScraper):
+    """Board on Lever's postings API (`api.lever.co/v0/postings/<site>`).
+
+    Lever's `location=` filter only matches a posting's primary location exactly, so a
+    posting with a Swiss secondary location (or a differently spelled one) would be
+    missed. The board is therefore streamed whole and every location is checked.
+    """
+
+    API_URL = "https://api.lever.co/v0/postings/{site}"
+
+    def __init__(self, company_name: str, site: str, **kwargs):
+        super().__init__(company_name, **kwargs)
+        self.api_url = self.API_URL.format(site=site)
+
+    def _jobs(self) -> Iterator[Dict[str, Any]]:
+        # Lever returns the global board as one array; stream it and filter job by job.
+        yield from self.stream_items(self.api_url, headers=self.headers, params={"mode": "json"})
+
+    def _locations(self, job: Dict[str, Any]) -> List[str]:
+        categories = job.get("categories") or {}
+        return [categories.get("location", "")] + (categories.get("allLocations") or [])
+
+    def _make_listing(self, job: Dict[str, Any]) -> JobListing:
+        categories = job.get("categories") or {}
+        return self.listing_class(
+            listing_id=str(job.get("id", "")),
+            title=job.get("text", ""),
+            location=categories.get("location", ""),
+            department=categories.get("team", ""),
+            link=job.get("hostedUrl", "")
+        )
+
+
+class AshbyJobScraper(PublicATSScraper):
+    """Board on Ashby's posting API (`api.ashbyhq.com/posting-api/job-board/<board>`).
+
+    The API has neither location filters nor pages, so the board is streamed and filtered
+    job by job on its primary and secondary locations.
+    """
+
+    API_URL = "https://api.ashbyhq.com/posting-api/job-board/{board}"
+
+    def __init__(self, company_name: str, board: str, **kwargs):
+        super().__init__(company_name, **kwargs)
+        self.api_url = self.API_URL.format(board=board)
+
+    def _jobs(self) -> Iterator[Dict[str, Any]]:
+        yield from self.stream_items(self.api_url, "jobs", headers=self.headers,
+                                     params={"includeCompensation": "false"})
+
+    def _locations(self, job: Dict[str, Any]) -> List[str]:
+        return [job.get("location", "")] + [s.get("location", "") for s in (job.get("secondaryLocations") or [])]
+
+    def _make_listing(self, job: Dict[str, Any]) -> JobListing:
+        return self.listing_class(
+            listing_id=str(job.get("id", "")),
+            title=job.get("title", ""),
+            location=job.get("location", ""),
+            department=job.get("department", ""),
+            link=job.get("jobUrl", "")
+        )
+
+
+class SmartRecruitersJobScraper(PublicATSScraper):
+    """Board on the SmartRecruiters posting API (`api.smartrecruiters.com/v1/companies/<id>/postings`).
+
+    `server_filters` (e.g. {"country": "ch"}) narrow the postings on the server. The first
+    page reports `totalFound`; the remaining offsets are then fetched concurrently.
+    """
+
+    listing_class = SmartRecruitersJobListing
+
+    API_URL = "https://api.smartrecruiters.com/v1/companies/{company}/postings"
+    # Largest page the API serves.
+    PAGE_SIZE = 100
+
+    def __init__(self, company_name: str, company_id: str, careers_slug: str = None,
+                 server_filters: Dict[str, str] = None, location_terms: Iterable[str] = (), **kwargs):
+        super().__init__(company_name, location_terms=location_terms, **kwargs)
+        self.api_url = self.API_URL.format(company=company_id)
+        self.careers_slug = careers_slug or company_id
+        self.server_filters = server_filters or {}
+
+    def _fetch_page(self, offset: int) -> Dict[str, Any]:
+        return self._get_json(self.api_url, params=dict(self.server_filters, limit=self.PAGE_SIZE, offset=offset))
+
+    def _jobs(self) -> Iterator[Dict[str, Any]]:
+        first = self._fetch_page(0)
+        total = first.get("totalFound", 0)
+        pages = [first] + http_client.fetch_all(self._fetch_page, range(self.PAGE_SIZE, total, self.PAGE_SIZE))
+        for page in pages:
+            yield from page.get("content", [])
+
+    def _locations(self, job: Dict[str, Any]) -> List[str]:
+        location = job.get("location") or {}
+        return [location.get("fullLocation", ""), location.get("country", "")]
+
+    def _make_listing(self, job: Dict[str, Any]) -> JobListing:
+        return self.listing_class(
+            listing_id=job["id"],
+            title=job["name"],
+            profession=(job.get("function") or {}).get("label", "N/A"),
+            location=(job.get("location") or {}).get("fullLocation", "N/A"),
+            link=f"https://jobs.smartrecruiters.com/{self.careers_slug}/{job['id']}"
+        )
+
+
+class RecruiteeJobScraper(PublicATSScraper):
+    """Board on Recruitee's careers-site API (`<company>.recruitee.com/api/offers`).
+
+    The API returns every published offer in one response and has no location filter,
+    so offers are kept by their country and location.
+    """
+
+    listing_class = RecruiteeJobListing
+
+    API_URL = "https://{company}.recruitee.com/api/offers"
+
+    def __init__(self, company_name: str, company_id: str, **kwargs):
+        super().__init__(company_name, **kwargs)
+        self.api_url = self.API_URL.format(company=company_id)
+
+    def _jobs(self) -> Iterator[Dict[str, Any]]:
+        yield from self._get_json(self.api_url).get("offers", [])
+
+    def _locations(self, job: Dict[str, Any]) -> List[str]:
+        return [job.get("country", ""), job.get("location", "")]
+
+    def _make_listing(self, job: Dict[str, Any]) -> JobListing:
+        return self.listing_class(
+            listing_id=str(job.get("id", "")),
+            title=job.get("title", ""),
+            location=job.get("location", ""),
+            posted_date=job.get("published_at", ""),
+            link=job.get("careers_apply_url", "")
+        )
@@ -1,69 +1,38 @@
 from lib.base_joblisting import JobListing
-from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
-import requests
-import logging
+from lib.greenhouse import GreenhouseJobScraper
+from typing import Dict, Any
 
 # -------------------------------
 # Job Listing Class
 # -------------------------------
 class QRTJobListing(JobListing):
+    __slots__ = ("id", "title", "location", "link")
+
     def __init__(self, listing_id: str, title: str, location: str):
         self.id = listing_id
         self.title = title
         self.location = location
         self.link = f"https://www.qube-rt.com/careers/job?gh_jid={listing_id}"
 
-    def get_id(self):
-        return self.id
-
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "title": self.title,
-            "location": self.location,
-            "link": self.link
-        }
-
 # -------------------------------
 # Scraper Class
 # -------------------------------
-class QRTJobScraper(JobScraper):
-    def __init__(self):
-        super().__init__(company_name="Qube Research & Technologies")
-        self.logo_path = "lib/qrt.png"
-        self.url = "https://boards-api.greenhouse.io/v1/boards/quberesearchandtechnologies/jobs"
+class QRTJobScraper(GreenhouseJobScraper):
+    listing_class = QRTJobListing
 
-    def scrape(self):
-        try:
-            response = requests.get(self.url).json()
-            jobs_on_board = response.get("jobs", [])
-        except Exception as e:
-            logging.error(f"Unable to fetch job listings: {e}")
-            return []
+    def __init__(self):
+        super().__init__("Qube Research & Technologies", "quberesearchandtechnologies", logo_path="lib/qrt.png")
 
+    def _matches(self, job: Dict[str, Any]) -> bool:
         # Filter only jobs in Zurich
-        zurich_jobs = [
-            job for job in jobs_on_board
-            if "zurich" in job.get("location", {}).get("name", "").lower()
-        ]
-
-        self.current_listings.extend([
-            QRTJobListing(
-                listing_id=job["id"],
-                title=job["title"],
-                location=job.get("location", {}).get("name", "N/A")
-            )
-            for job in zurich_jobs
-        ])
-
-        return self.current_listings
+        return "zurich" in self._location(job).lower()
 
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> QRTJobListing:
+    def _make_listing(self, job: Dict[str, Any]) -> QRTJobListing:
+        # Ids stay ints, as in the saved state.
         return QRTJobListing(
-            listing_id=data["id"],
-            title=data["title"],
-            location=data.get("location", "N/A")
+            listing_id=job["id"],
+            title=job["title"],
+            location=job.get("location", {}).get("name", "N/A")
         )
 
 # -------------------------------
@@ -0,0 +1,96 @@
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait before using it.
+
+        The bucket is allowed to go negative, which queues concurrent callers behind each
+        other instead of letting them all wake up at the same moment.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class HostRateLimiter:
+    """Per-host politeness budget shared by every scraper in the process.
+
+    Each bucket key gets its own token bucket, so unrelated hosts never slow each other
+    down while scrapers that hit the same backend share one budget.
+    """
+
+    DEFAULT_LIMIT = (4.0, 4)  # (requests per second, burst)
+
+    # Overrides for backends that several scrapers share, as (requests per second, burst).
+    HOST_LIMITS: Dict[str, Tuple[float, int]] = {
+        # Nine Greenhouse boards live on the same API host.
+        "boards-api.greenhouse.io": (3.0, 3),
+        "successfactors": (3.0, 3),
+        # Telegram allows about one message per second per chat; every company's
+        # notifications go to the same chats.
+        "api.telegram.org": (1.0, 1),
+    }
+
+    # Hostnames that are really the same backend and must share one bucket.
+    SHARED_BACKENDS: Dict[str, str] = {
+        # Post, PostFinance and Mobiliar all run on SAP SuccessFactors.
+        "job.post.ch": "successfactors",
+        "jobs.postfinance.ch": "successfactors",
+        "jobs.mobiliar.ch": "successfactors",
+    }
+
+    def __init__(self):
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.lock = threading.Lock()
+        self.waited = defaultdict(float)
+        self.requests = defaultdict(int)
+
+    def bucket_key(self, url: str) -> str:
+        host = (urlsplit(url).hostname or "").lower()
+        return self.SHARED_BACKENDS.get(host, host)
+
+    def _bucket(self, key: str) -> TokenBucket:
+        with self.lock:
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                rate, burst = self.HOST_LIMITS.get(key, self.DEFAULT_LIMIT)
+                bucket = self.buckets[key] = TokenBucket(rate, burst)
+            return bucket
+
+    def wait(self, url: str) -> float:
+        """Block until a request to `url` fits the host's budget; returns the time waited."""
+        key = self.bucket_key(url)
+        delay = self._bucket(key).reserve()
+        if delay > 0:
+            time.sleep(delay)
+        with self.lock:
+            self.requests[key] += 1
+            self.waited[key] += delay
+        return delay
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Requests made and total seconds spent waiting, per bucket."""
+        with self.lock:
+            return {key: {"requests": self.requests[key], "waited": round(self.waited[key], 2)}
+                    for key in self.requests}
+
+
+# Shared by every scraper so the budget holds across the whole run.
+limiter = HostRateLimiter()
@@ -0,0 +1,93 @@
+import importlib
+from typing import Any, Iterable, List, NamedTuple
+
+
+# How often a company is due when main_scraper.py runs with --only-due.
+DEFAULT_INTERVAL_HOURS = 1.0
+# Workday and SuccessFactors tenants, and Adobe's repeated sweeps: each run pages through
+# the whole search, while the Swiss results change a few times a week.
+PAGINATED_INTERVAL_HOURS = 3.0
+# SAP recruiting sweeps query every locale of the tenant, up to 20 pages each.
+SWEEP_INTERVAL_HOURS = 4.0
+# prospective.ch catalogues (the federal administration, Raiffeisen), which change at
+# most daily.
+CATALOGUE_INTERVAL_HOURS = 6.0
+
+
+class ScraperSpec(NamedTuple):
+    """Where a company's scraper lives. The module is only imported by load()."""
+    company: str
+    module: str
+    class_name: str
+    interval_hours: float = DEFAULT_INTERVAL_HOURS
+
+    def load(self) -> type:
+        return getattr(importlib.import_module(self.module), self.class_name)
+
+    def create(self) -> Any:
+        return self.load()()
+
+
+# Every company, in the order a full run processes them. `company` must match the
+# scraper's own company name; it is what filters select on and names the state folder.
+SCRAPERS: List[ScraperSpec] = [
+    ScraperSpec("Google", "lib.google_scraper", "GoogleJobScraper"),
+    ScraperSpec("Meta", "lib.meta_scraper", "MetaJobScraper"),
+    ScraperSpec("Nvidia", "lib.nvidia_scraper", "NvidiaJobScraper", PAGINATED_INTERVAL_HOURS),
+    ScraperSpec("Apple", "lib.apple_scraper", "AppleJobScraper"),
+    ScraperSpec("Microsoft", "lib.microsoft_scraper", "MicrosoftJobScraper"),
+    ScraperSpec("Snap", "lib.snap_scraper", "SnapJobScraper"),
+    ScraperSpec("Amazon", "lib.amazon_scraper", "AmazonJobScraper"),
+    ScraperSpec("BKW", "lib.bkw_scraper", "BKWJobScraper"),
+    ScraperSpec("LGTCP", "lib.lgtcp_scraper", "LGTCPJobScraper", PAGINATED_INTERVAL_HOURS),
+    ScraperSpec("JB", "lib.juliusbaer_scraper", "JBJobScraper", PAGINATED_INTERVAL_HOURS),
+    ScraperSpec("LGT", "lib.lgt_scraper", "LGTJobScraper"),
+    ScraperSpec("ZKB", "lib.zkb_scraper", "ZKBJobScraper"),
+    ScraperSpec("Alpiq", "lib.alpiq_scraper", "AlpiqJobScraper", PAGINATED_INTERVAL_HOURS),
+    ScraperSpec("MET Group", "lib.metgroup_scraper", "METJobScraper"),
+    ScraperSpec("Citadel Securities", "lib.citadel_scraper", "CitadelJobScraper"),
+    ScraperSpec("Qube Research & Technologies", "lib.qrt_scraper", "QRTJobScraper"),
+    ScraperSpec("GetYourGuide", "lib.getyourguide_scraper", "GetYourGuideJobScraper"),
+    ScraperSpec("IBM", "lib.ibm_scraper", "IBMJobScraper"),
+    ScraperSpec("Oracle", "lib.oracle_scraper", "OracleJobScraper"),
+    ScraperSpec("Axpo", "lib.axpo_scraper", "AxpoJobScraper"),
+    ScraperSpec("Bundesverwaltung", "lib.bundesverwaltung_scraper", "BundesverwaltungJobScraper", CATALOGUE_INTERVAL_HOURS),
+    ScraperSpec("IMC", "lib.imc_scraper", "IMCJobScraper"),
+    ScraperSpec("Mathrix Group", "lib.mathrix_scraper", "MathrixJobScraper"),
+    ScraperSpec("SBB", "lib.sbb_scraper", "SBBJobScraper"),
+    ScraperSpec("Swisscom", "lib.swisscom_scraper", "SwisscomJobScraper", PAGINATED_INTERVAL_HOURS),
+    ScraperSpec("Swiss Re", "lib.swissre_scraper", "SwissReJobScraper", PAGINATED_INTERVAL_HOURS),
+    ScraperSpec("Zurich Insurance", "lib.zurich_scraper", "ZurichJobScraper", PAGINATED_INTERVAL_HOURS),
+    ScraperSpec("PostFinance", "lib.postfinance_scraper", "PostFinanceJobScraper", SWEEP_INTERVAL_HOURS),
+    ScraperSpec("Mobiliar", "lib.mobiliar_scraper", "MobiliarJobScraper", SWEEP_INTERVAL_HOURS),
+    ScraperSpec("Red Hat", "lib.redhat_scraper", "RedHatJobScraper", PAGINATED_INTERVAL_HOURS),
+    ScraperSpec("Databricks", "lib.databricks_scraper", "DatabricksJobScraper"),
+    ScraperSpec("Millennium", "lib.millennium_scraper", "MillenniumJobScraper"),
+    ScraperSpec("Vontobel", "lib.vontobel_scraper", "VontobelJobScraper"),
+    ScraperSpec("SNB", "lib.snb_scraper", "SNBJobScraper", PAGINATED_INTERVAL_HOURS),
+    ScraperSpec("Adobe", "lib.adobe_scraper", "AdobeJobScraper", PAGINATED_INTERVAL_HOURS),
+    ScraperSpec("SIX", "lib.six_scraper", "SIXJobScraper", PAGINATED_INTERVAL_HOURS),
+    ScraperSpec("DeepMind", "lib.deepmind_scraper", "DeepMindJobScraper"),
+    ScraperSpec("Anthropic", "lib.anthropic_scraper", "AnthropicJobScraper"),
+    ScraperSpec("Thomson Reuters", "lib.thomsonreuters_scraper", "ThomsonReutersJobScraper", PAGINATED_INTERVAL_HOURS),
+    ScraperSpec("Squarepoint", "lib.squarepoint_scraper", "SquarepointJobScraper"),
+    ScraperSpec("Man Group", "lib.man_scraper", "ManJobScraper"),
+    ScraperSpec("WorldQuant", "lib.worldquant_scraper", "WorldQuantJobScraper"),
+    ScraperSpec("OpenAI", "lib.openai_scraper", "OpenAIJobScraper"),
+    ScraperSpec("Palantir", "lib.palantir_scraper", "PalantirJobScraper"),
+    ScraperSpec("UBS", "lib.ubs_scraper", "UBSJobScraper"),
+    ScraperSpec("Raiffeisen", "lib.raiffeisen_scraper", "RaiffeisenJobScraper", CATALOGUE_INTERVAL_HOURS),
+    ScraperSpec("Partners Group", "lib.partnersgroup_scraper", "PartnersGroupJobScraper"),
+    ScraperSpec("Isomorphic Labs", "lib.isomorphic_scraper", "IsomorphicJobScraper"),
+    ScraperSpec("Glencore", "lib.glencore_scraper", "GlencoreJobScraper"),
+    ScraperSpec("Huawei", "lib.huawei_scraper", "HuaweiJobScraper"),
+    ScraperSpec("Post", "lib.post_scraper", "PostJobScraper", SWEEP_INTERVAL_HOURS),
+]
+
+
+def select(filters: Iterable[str] = ()) -> List[ScraperSpec]:
+    """Specs whose company contains any of `filters` (case-insensitive); all if none given."""
+    filters = [f.lower() for f in filters]
+    if not filters:
+        return list(SCRAPERS)
+    return [spec for spec in SCRAPERS if any(f in spec.company.lower() for f in filters)]
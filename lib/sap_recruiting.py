@@ -0,0 +1,143 @@
+from lib.base_joblisting import JobListing
+from lib.base_scraper import JobScraper
+from lib import http_client
+from typing import List, Dict, Any, Tuple, Optional
+from abc import abstractmethod
+import threading
+import logging
+
+
+class RecruitingJobListing(JobListing):
+    __slots__ = ("id", "title", "link", "department", "city", "pensum")
+
+    def __init__(self, listing_id: str, title: str, link: str, department: str, city: str, pensum: str):
+        self.id = listing_id
+        self.title = title
+        self.link = link
+        self.department = department
+        self.city = city
+        self.pensum = pensum
+
+
+def cities(job: Dict[str, Any]) -> str:
+    # "Bern|Bern|BE|Schweiz|CHE " -> "Bern"
+    names = [loc.split("|")[0].strip() for loc in job.get("jobLocationShort", [])]
+    return ", ".join(dict.fromkeys(c for c in names if c))
+
+
+def pensum(job: Dict[str, Any]) -> str:
+    wmin = (job.get("cust_WorkingTimeMin") or [""])[0]
+    wmax = (job.get("cust_WorkingTimeMax") or [""])[0]
+    return f"{wmin}-{wmax}%" if wmin and wmax else (f"{wmin or wmax}%" if (wmin or wmax) else "")
+
+
+class RecruitingSweep:
+    """One concurrent pass over a tenant's `services/recruiting/v1/jobs` API.
+
+    Every locale is queried in parallel; within a locale page 0 reports totalJobs and the
+    remaining pages are fetched together. Jobs are deduped by id as the workers return
+    them: a job published in several locales is kept under the first locale in
+    `locales`, so the result does not depend on which request finished first.
+
+    The sweep runs once per process and is shared by every brand scraper built on it.
+    """
+
+    MAX_PAGES = 20
+
+    def __init__(self, url: str, headers: Dict[str, str], locales: List[str],
+                 payload: Dict[str, Any] = None, max_pages: Optional[int] = MAX_PAGES):
+        self.url = url
+        self.headers = headers
+        self.locales = locales
+        self.payload = payload or {"sortBy": "date"}
+        self.max_pages = max_pages
+
+        self._run_lock = threading.Lock()
+        self._claim_lock = threading.Lock()
+        self._claimed: Dict[str, Tuple[Tuple[int, int, int], str, Dict[str, Any]]] = {}
+        self._result: Optional[List[Tuple[str, Dict[str, Any]]]] = None
+        self._error: Optional[Exception] = None
+
+    def _fetch_page(self, locale: str, page: int) -> Dict[str, Any]:
+        payload = dict(self.payload, locale=locale, pageNumber=page)
+        response = http_client.post(self.url, headers=self.headers, json=payload)
+        response.raise_for_status()
+        return response.json()
+
+    def _claim(self, rank: int, page: int, results: List[Dict[str, Any]], locale: str) -> None:
+        with self._claim_lock:
+            for index, item in enumerate(results):
+                job = item.get("response", {})
+                listing_id = str(job.get("id", ""))
+                if not listing_id:
+                    continue
+                order = (rank, page, index)
+                current = self._claimed.get(listing_id)
+                if current is None or order < current[0]:
+                    self._claimed[listing_id] = (order, locale, job)
+
+    def _sweep_locale(self, rank: int, locale: str) -> None:
+        # totalJobs is per locale, so each locale paginates on its own count.
+        first = self._fetch_page(locale, 0)
+        results = first.get("jobSearchResult", [])
+        if not results:
+            return
+        self._claim(rank, 0, results, locale)
+
+        page_count = -(-first.get("totalJobs", 0) // len(results))
+        if self.max_pages is not None:
+            page_count = min(page_count, self.max_pages)
+
+        def fetch(page: int) -> None:
+            self._claim(rank, page, self._fetch_page(locale, page).get("jobSearchResult", []), locale)
+
+        http_client.fetch_all(fetch, range(1, page_count))
+
+    def jobs(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """(locale, job) for every job on the tenant, deduped by id. Raises if the sweep failed."""
+        with self._run_lock:
+            if self._result is None and self._error is None:
+                try:
+                    http_client.fetch_all(lambda item: self._sweep_locale(*item), list(enumerate(self.locales)))
+                    ordered = sorted(self._claimed.values(), key=lambda claimed: claimed[0])
+                    self._result = [(locale, job) for _, locale, job in ordered]
+                except Exception as e:
+                    # A partial sweep would show up as delistings for every brand on it.
+                    self._error = e
+            if self._error is not None:
+                raise self._error
+            return self._result
+
+
+class SAPRecruitingJobScraper(JobScraper):
+    """A brand's view of a shared RecruitingSweep; subclasses filter and build listings."""
+
+    listing_class = RecruitingJobListing
+
+    def __init__(self, company_name: str, sweep: RecruitingSweep, logo_path: str = None):
+        super().__init__(company_name=company_name)
+        self.sweep = sweep
+        self.logo_path = logo_path
+
+    def _matches(self, locale: str, job: Dict[str, Any]) -> bool:
+        return True
+
+    @abstractmethod
+    def _make_listing(self, locale: str, job: Dict[str, Any]) -> JobListing:
+        """Build the brand's listing for a kept job."""
+
+    def scrape(self) -> List[JobListing]:
+        listings = []
+
+        try:
+            jobs = self.sweep.jobs()
+        except Exception as e:
+            logging.error(f"{self.company} scrape failed: {e}")
+            return listings
+
+        for locale, job in jobs:
+            if self._matches(locale, job):
+                listings.append(self._make_listing(locale, job))
+
+        self.current_listings = listings
+        return listings
@@ -1,31 +1,24 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
-import requests
+from lib import http_client
+from typing import List
 import logging
 
 
 class SBBJobListing(JobListing):
+    __slots__ = ("id", "title", "location", "link")
+    company = "SBB"
+
     def __init__(self, listing_id: str, title: str, location: str, link: str):
         self.id = listing_id
         self.title = title
         self.location = location
         self.link = link
-        self.company = "SBB"
-
-    def get_id(self) -> str:
-        return self.id
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "location": self.location,
-            "link": self.link
-        }
 
 
 class SBBJobScraper(JobScraper):
+    listing_class = SBBJobListing
+
     def __init__(self):
         super().__init__(company_name="SBB")
         self.api_url = "https://company.sbb.ch/content/internet/corporate/de/jobs-karriere/jobs/job-suche/jcr:content/parmain/jobfilter.results.json"
@@ -43,7 +36,7 @@ class SBBJobScraper(JobScraper):
         }
 
         try:
-            response = requests.get(self.api_url, headers=headers)
+            response = http_client.get(self.api_url, headers=headers)
 
             if response.status_code != 200:
                 logging.error(f"SBB API returned {response.status_code}")
@@ -80,12 +73,3 @@ class SBBJobScraper(JobScraper):
             logging.error(f"Error scraping SBB jobs: {e}")
 
         return listings
-
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> SBBJobListing:
-        """Convert a dictionary back into an SBBJobListing object."""
-        return SBBJobListing(
-            listing_id=data["id"],
-            title=data["title"],
-            location=data["location"],
-            link=data["link"]
-        )
@@ -1,25 +1,19 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
-import requests
-import logging
-import re
-import json
+from lib import http_client
  
 class SnapJobListing(JobListing):
+    __slots__ = ("id", "title", "location", "link")
+
     def __init__(self, listing_id: str, title:str, location: str, link: str):
         self.id = listing_id
         self.title = title
         self.location = location
         self.link = link
-        
-    def get_id(self):
-        return self.id
-
-    def to_dict(self):
-        return {"id": self.id, "title": self.title, "location": self.location, "link": self.link}
 
 class SnapJobScraper(JobScraper):
+    listing_class = SnapJobListing
+
     def __init__(self):
         super().__init__(company_name="Snap")
         self.logo_path = "lib/snap.png"
@@ -57,11 +51,9 @@ class SnapJobScraper(JobScraper):
         }
         
     def scrape(self):
-        response = requests.get('https://careers.snap.com/api/jobs', params=self.params, headers=self.headers, cookies=self.cookies)
+        response = http_client.get('https://careers.snap.com/api/jobs', params=self.params, headers=self.headers, cookies=self.cookies)
         if response.status_code == 200:
             response = response.json()["body"]
         self.current_listings.extend([SnapJobListing(a["_source"]["id"], a["_source"]["title"], a["_source"]["primary_location"], a["_source"]["absolute_url"]) for a in response])
         return self.current_listings
-        
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> SnapJobListing:
-        return SnapJobListing(data["id"], data["title"], data["location"], data["link"])
+        
\ No newline at end of file
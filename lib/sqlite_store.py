@@ -0,0 +1,166 @@
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Any, List, Tuple
+
+from lib import codec
+from lib.state_store import DELIST_GRACE_HOURS, JsonListingStore
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS companies (
+    company     TEXT PRIMARY KEY,
+    synced_at   TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS listings (
+    company       TEXT NOT NULL,
+    id            TEXT NOT NULL,
+    data          TEXT NOT NULL,   -- listing.to_state() as JSON
+    fingerprint   TEXT,            -- listing.fingerprint(), compared to detect edits
+    first_seen    TEXT NOT NULL,
+    last_seen     TEXT NOT NULL,
+    missing_since TEXT,            -- set while the listing is inside its delisting grace period
+    PRIMARY KEY (company, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS listings_missing
+    ON listings (company, missing_since) WHERE missing_since IS NOT NULL;
+"""
+
+
+class SQLiteListingStore:
+    """Listing store for every company in one SQLite database (WAL mode).
+
+    Each listing row carries first_seen / last_seen and, while it is missing from its
+    board, missing_since -- the delisting grace state that the JSON backend keeps in
+    delisting_tracker.json. A sync is one transaction of indexed set queries against a
+    temp table of the scraped ids, so its cost does not depend on how many companies
+    or runs the database holds, and the whole run uses a single file handle.
+
+    A company the database has not seen yet is imported once from its JSON folder, so
+    switching backends does not report every saved listing as new.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        columns = {name for (_, name, *_) in self.conn.execute("PRAGMA table_info(listings)")}
+        if "fingerprint" not in columns:
+            # Databases created before fingerprints; rows get one on their next sync.
+            self.conn.execute("ALTER TABLE listings ADD COLUMN fingerprint TEXT")
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS scraped "
+                          "(id TEXT PRIMARY KEY, data TEXT NOT NULL, fingerprint TEXT NOT NULL)")
+
+    def _known(self, company: str) -> bool:
+        return self.conn.execute("SELECT 1 FROM companies WHERE company = ?", (company,)).fetchone() is not None
+
+    def _import_json(self, scraper: Any) -> None:
+        """Seed a company from its JSON state and tracker (caller holds the lock)."""
+        json_store = JsonListingStore()
+        if not json_store.has_state(scraper):
+            return
+        tracker = json_store._load_tracker(scraper.company)
+        now = datetime.now().isoformat()
+        rows = [(scraper.company, str(job.get_id()), codec.dumps(job.to_state()).decode(), job.fingerprint(),
+                 now, now, tracker.get(str(job.get_id())))
+                for job in scraper.load_previous_state()]
+        self.conn.execute("BEGIN")
+        self.conn.executemany(
+            """INSERT OR IGNORE INTO listings (company, id, data, fingerprint, first_seen, last_seen, missing_since)
+               VALUES (?, ?, ?, ?, ?, ?, ?)""", rows)
+        self.conn.execute("INSERT OR REPLACE INTO companies VALUES (?, ?)", (scraper.company, now))
+        self.conn.execute("COMMIT")
+
+    def _ensure(self, scraper: Any) -> None:
+        if not self._known(scraper.company):
+            self._import_json(scraper)
+
+    def has_state(self, scraper: Any) -> bool:
+        with self.lock:
+            self._ensure(scraper)
+            return self._known(scraper.company)
+
+    def has_pending(self, scraper: Any) -> bool:
+        with self.lock:
+            self._ensure(scraper)
+            return self.conn.execute(
+                "SELECT 1 FROM listings WHERE company = ? AND missing_since IS NOT NULL LIMIT 1",
+                (scraper.company,)).fetchone() is not None
+
+    def live_listings(self, scraper: Any) -> List[Any]:
+        with self.lock:
+            self._ensure(scraper)
+            rows = self.conn.execute(
+                "SELECT data FROM listings WHERE company = ? AND missing_since IS NULL",
+                (scraper.company,)).fetchall()
+        return [scraper._create_listing_from_dict(codec.loads(data)) for (data,) in rows]
+
+    def sync(self, scraper: Any, scraped: List[Any]) -> Tuple[List[Any], List[Any], List[Any]]:
+        company = scraper.company
+        now = datetime.now().isoformat()
+        cutoff = (datetime.now() - timedelta(hours=DELIST_GRACE_HOURS)).isoformat()
+        by_id = {str(job.get_id()): job for job in scraped}
+
+        with self.lock:
+            self._ensure(scraper)
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.execute("DELETE FROM scraped")
+                self.conn.executemany("INSERT OR REPLACE INTO scraped VALUES (?, ?, ?)",
+                                      [(jid, codec.dumps(job.to_state()).decode(), job.fingerprint())
+                                       for jid, job in by_id.items()])
+
+                # New: scraped but not saved. A listing inside its grace period is still
+                # saved, so a flicker reappearance is not reported again.
+                new_ids = {jid for (jid,) in self.conn.execute(
+                    "SELECT id FROM scraped WHERE id NOT IN (SELECT id FROM listings WHERE company = ?)",
+                    (company,))}
+
+                # Same id, different content. Rows saved before fingerprints existed have
+                # none yet and are not reported.
+                updated_ids = {jid for (jid,) in self.conn.execute(
+                    """SELECT s.id FROM scraped s JOIN listings l ON l.company = ? AND l.id = s.id
+                       WHERE l.fingerprint IS NOT NULL AND l.fingerprint != s.fingerprint""",
+                    (company,))}
+
+                # Everything on the board is seen now and no longer pending.
+                self.conn.execute(
+                    """INSERT INTO listings (company, id, data, fingerprint, first_seen, last_seen, missing_since)
+                       SELECT ?, id, data, fingerprint, ?, ?, NULL FROM scraped WHERE true
+                       ON CONFLICT (company, id) DO UPDATE SET
+                           data = excluded.data, fingerprint = excluded.fingerprint,
+                           last_seen = excluded.last_seen, missing_since = NULL""",
+                    (company, now, now))
+
+                # Missing from the board: start the grace period, report once it has passed.
+                self.conn.execute(
+                    """UPDATE listings SET missing_since = ?
+                       WHERE company = ? AND missing_since IS NULL
+                         AND id NOT IN (SELECT id FROM scraped)""",
+                    (now, company))
+                delisted = [data for (data,) in self.conn.execute(
+                    """SELECT data FROM listings
+                       WHERE company = ? AND missing_since <= ? AND id NOT IN (SELECT id FROM scraped)""",
+                    (company, cutoff))]
+                self.conn.execute(
+                    """DELETE FROM listings
+                       WHERE company = ? AND missing_since <= ? AND id NOT IN (SELECT id FROM scraped)""",
+                    (company, cutoff))
+
+                self.conn.execute("INSERT OR REPLACE INTO companies VALUES (?, ?)", (company, now))
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+        scraper.current_listings = list(by_id.values())
+        new_listings = [job for jid, job in by_id.items() if jid in new_ids]
+        updated_listings = [job for jid, job in by_id.items() if jid in updated_ids]
+        confirmed_delisted = [scraper._create_listing_from_dict(codec.loads(data)) for data in delisted]
+        return new_listings, updated_listings, confirmed_delisted
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,292 @@
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from lib import codec, durable
+from lib.base_joblisting import FINGERPRINT
+
+LEGACY_STATE = re.compile(r"^state_(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})\.json$")
+
+
+def _by_id(listings: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    return {str(listing.get("id")): listing for listing in listings}
+
+
+def _changed(old: Dict[str, Any], new: Dict[str, Any]) -> bool:
+    # Saved listings carry a content fingerprint; states written before fingerprints
+    # existed fall back to comparing the fields.
+    if FINGERPRINT in old and FINGERPRINT in new:
+        return old[FINGERPRINT] != new[FINGERPRINT]
+    return old != new
+
+
+class StateStore:
+    """A company's saved listings as a base snapshot plus a log of deltas against it.
+
+    `base.json` holds the listings as of the last compaction. Every save appends one line
+    to `deltas.jsonl` with only what changed (added, updated and removed listings), so
+    the bytes written follow the size of the change, not the size of the board. Loading
+    replays the deltas over the base. Once MAX_DELTAS have piled up, or they reach half
+    the size of the base, a save compacts: it writes a new base and moves the deltas to
+    the append-only `history.jsonl`, which keeps the full change history.
+
+    The base is replaced atomically. Deltas carry a sequence number and the base records
+    the last one it contains, so a crash between writing a base and clearing the deltas
+    replays nothing twice. A delta line torn by a crash is ignored and forces the next
+    save to compact.
+
+    Older folders are migrated on first load: `current.json` becomes the base, and
+    legacy `state_<timestamp>.json` snapshots are folded into history.jsonl and removed.
+    """
+
+    BASE = "base.json"
+    DELTAS = "deltas.jsonl"
+    HISTORY = "history.jsonl"
+    PREVIOUS_CURRENT = "current.json"
+
+    MAX_DELTAS = 50
+
+    def __init__(self, folder: str):
+        self.folder = folder
+        self.base_path = os.path.join(folder, self.BASE)
+        self.deltas_path = os.path.join(folder, self.DELTAS)
+        self.history_path = os.path.join(folder, self.HISTORY)
+        self.previous_current_path = os.path.join(folder, self.PREVIOUS_CURRENT)
+
+    def exists(self) -> bool:
+        return (os.path.exists(self.base_path) or os.path.exists(self.deltas_path)
+                or os.path.exists(self.previous_current_path) or bool(self._legacy_states()))
+
+    def load(self) -> Optional[List[Dict[str, Any]]]:
+        """Latest saved listings, or None if nothing has been saved yet."""
+        if not self.exists():
+            return None
+        self._migrate()
+        listings, _, _, _ = self._read()
+        return list(listings.values())
+
+    def save(self, listings: List[Dict[str, Any]]) -> None:
+        """Make `listings` the saved state, writing only what changed since the last save."""
+        self._migrate()
+        state, seq, deltas, torn = self._read()
+        entry = self._diff(list(state.values()), listings, datetime.now().isoformat(timespec="seconds"))
+        if entry is None and not torn:
+            return
+
+        seq += 1
+        if entry is not None:
+            entry["seq"] = seq
+            deltas.append(entry)
+        line = codec.dumps(entry) if entry is not None else b""
+
+        if torn or len(deltas) >= self.MAX_DELTAS or self._deltas_size() + len(line) > self._base_size() // 2:
+            self._compact(listings, seq, deltas)
+        else:
+            durable.append_line(self.deltas_path, line)
+
+    def _read(self) -> Tuple[Dict[str, Dict[str, Any]], int, List[Dict[str, Any]], bool]:
+        """(listings by id, last sequence number, deltas since the base, torn last delta)."""
+        listings: Dict[str, Dict[str, Any]] = {}
+        seq = 0
+        if os.path.exists(self.base_path):
+            base = codec.read(self.base_path)
+            listings = _by_id(base.get("listings", []))
+            seq = base.get("seq", 0)
+
+        deltas, torn = self._read_deltas()
+        pending = []
+        for delta in deltas:
+            if delta["seq"] <= seq:
+                continue
+            for listing in delta["added"] + delta["updated"]:
+                listings[str(listing.get("id"))] = listing
+            for listing_id in delta["removed"]:
+                listings.pop(listing_id, None)
+            seq = delta["seq"]
+            pending.append(delta)
+        return listings, seq, pending, torn
+
+    def _read_deltas(self) -> Tuple[List[Dict[str, Any]], bool]:
+        if not os.path.exists(self.deltas_path):
+            return [], False
+        with open(self.deltas_path, "rb") as f:
+            lines = [line for line in f.read().split(b"\n") if line]
+        deltas = []
+        for i, line in enumerate(lines):
+            try:
+                deltas.append(codec.loads(line))
+            except ValueError:
+                # Only the last line can be cut short by a crash; anything else is damage.
+                if i == len(lines) - 1:
+                    return deltas, True
+                raise
+        return deltas, False
+
+    def _base_size(self) -> int:
+        return os.path.getsize(self.base_path) if os.path.exists(self.base_path) else 0
+
+    def _deltas_size(self) -> int:
+        return os.path.getsize(self.deltas_path) if os.path.exists(self.deltas_path) else 0
+
+    def _compact(self, listings: List[Dict[str, Any]], seq: int, deltas: List[Dict[str, Any]]) -> None:
+        durable.write_json(self.base_path, {"seq": seq, "listings": listings})
+        if deltas:
+            durable.append_line(self.history_path, b"\n".join(codec.dumps(delta) for delta in deltas))
+        if os.path.exists(self.deltas_path):
+            os.remove(self.deltas_path)
+
+    @staticmethod
+    def _diff(old: List[Dict[str, Any]], new: List[Dict[str, Any]], time: str) -> Optional[Dict[str, Any]]:
+        old_by_id, new_by_id = _by_id(old), _by_id(new)
+        added = [listing for lid, listing in new_by_id.items() if lid not in old_by_id]
+        updated = [listing for lid, listing in new_by_id.items()
+                   if lid in old_by_id and _changed(old_by_id[lid], listing)]
+        removed = [lid for lid in old_by_id if lid not in new_by_id]
+        if not (added or updated or removed):
+            return None
+        return {"time": time, "added": added, "updated": updated, "removed": removed}
+
+    def _legacy_states(self) -> List[str]:
+        if not os.path.isdir(self.folder):
+            return []
+        return sorted(f for f in os.listdir(self.folder) if LEGACY_STATE.match(f))
+
+    def _migrate(self) -> None:
+        """Bring folders written by older versions to the base + deltas layout."""
+        if os.path.exists(self.previous_current_path) and not os.path.exists(self.base_path):
+            listings = codec.read(self.previous_current_path).get("listings", [])
+            durable.write_json(self.base_path, {"seq": 0, "listings": listings})
+            os.remove(self.previous_current_path)
+        if os.path.exists(self.base_path) or not self._legacy_states():
+            return
+
+        # Fold legacy timestamped snapshots into history.jsonl and a first base.
+        previous: List[Dict[str, Any]] = []
+        entries = []
+        folded = []
+        for name in self._legacy_states():
+            # An unreadable snapshot is skipped (and left on disk); the next one is
+            # diffed against the last good one.
+            try:
+                listings = codec.read(os.path.join(self.folder, name)).get("listings", [])
+            except (OSError, ValueError):
+                continue
+            folded.append(name)
+            stamp = datetime.strptime(LEGACY_STATE.match(name).group(1), "%Y-%m-%d_%H-%M-%S")
+            entry = self._diff(previous, listings, stamp.isoformat())
+            if entry is not None:
+                entries.append(entry)
+            previous = listings
+
+        if entries:
+            durable.append_line(self.history_path, b"\n".join(codec.dumps(entry) for entry in entries))
+        durable.write_json(self.base_path, {"seq": 0, "listings": previous})
+        for name in folded:
+            os.remove(os.path.join(self.folder, name))
+
+
+# Hours a listing may be missing from its board before it is reported as delisted. Boards
+# regularly drop a job for a run or two; the grace period keeps those flickers quiet.
+DELIST_GRACE_HOURS = 6
+
+
+class JsonListingStore:
+    """Listing store backed by per-company folders: a StateStore plus delisting_tracker.json.
+
+    Every store implements the same four calls, so main_scraper.py does not care which
+    backend is configured:
+
+        has_state(scraper)      a previous run's state exists
+        has_pending(scraper)    some saved listings are inside their delisting grace period
+        live_listings(scraper)  saved listings minus the pending ones
+        sync(scraper, scraped)  apply one scrape, returns (new, updated, confirmed delisted)
+    """
+
+    TRACKER = "delisting_tracker.json"
+
+    def has_state(self, scraper: Any) -> bool:
+        return scraper.has_previous_state()
+
+    def _load_tracker(self, folder: str) -> Dict[str, str]:
+        # Written atomically, so an unreadable tracker is real damage: raise instead of
+        # starting over, which would silently reset every grace period.
+        path = os.path.join(folder, self.TRACKER)
+        if not os.path.exists(path):
+            return {}
+        return codec.read(path)
+
+    def _save_tracker(self, folder: str, tracker: Dict[str, str]) -> None:
+        durable.write_json(os.path.join(folder, self.TRACKER), tracker)
+
+    def has_pending(self, scraper: Any) -> bool:
+        return bool(self._load_tracker(scraper.company))
+
+    def live_listings(self, scraper: Any) -> List[Any]:
+        tracker = self._load_tracker(scraper.company)
+        return [job for job in scraper.load_previous_state() if str(job.get_id()) not in tracker]
+
+    def sync(self, scraper: Any, scraped: List[Any]) -> Tuple[List[Any], List[Any], List[Any]]:
+        old_jobs = scraper.load_previous_state()
+        tracker = self._load_tracker(scraper.company)
+
+        # Keyed by str(id): the tracker is JSON, so its keys come back as strings even for
+        # boards whose ids are ints.
+        old_job_ids = {str(job.get_id()): job for job in old_jobs}
+        new_job_ids = {str(job.get_id()): job for job in scraped}
+
+        now = datetime.now().isoformat()
+        cutoff = (datetime.now() - timedelta(hours=DELIST_GRACE_HOURS)).isoformat()
+
+        # Jobs that disappeared: add to tracker if not already tracked
+        disappeared = {jid for jid in old_job_ids if jid not in new_job_ids}
+        for jid in disappeared:
+            if jid not in tracker:
+                tracker[jid] = now
+
+        # Only report delistings past the grace period
+        confirmed_delisted = [old_job_ids[jid] for jid in disappeared
+                              if tracker.get(jid, now) <= cutoff and jid in old_job_ids]
+
+        # Remove confirmed delistings from tracker
+        for job in confirmed_delisted:
+            tracker.pop(str(job.get_id()), None)
+
+        # New listings: only report if not in tracker (i.e. not a flicker reappearance)
+        new_listings = [job for jid, job in new_job_ids.items()
+                        if jid not in old_job_ids and jid not in tracker]
+
+        # Same id, different content: the fingerprints saved last run decide, so this is
+        # one string comparison per listing.
+        updated_listings = [job for jid, job in new_job_ids.items()
+                            if jid in old_job_ids and job.fingerprint() != old_job_ids[jid].fingerprint()]
+
+        # Jobs that reappeared: silently remove from tracker (after new_listings check)
+        for jid in list(tracker.keys()):
+            if jid in new_job_ids:
+                del tracker[jid]
+
+        # Drop stale entries: past the grace period and no longer in the saved state,
+        # so they can never be reported as delisted - they would only suppress a
+        # future NEW for that job forever.
+        for jid in list(tracker.keys()):
+            if jid not in old_job_ids and tracker[jid] <= cutoff:
+                del tracker[jid]
+
+        self._save_tracker(scraper.company, tracker)
+
+        # Persist the scrape plus anything still inside its delisting grace period.
+        # Saving only the raw scrape would drop a flickering job from the state while
+        # the tracker still holds it, and once the tracker clears it would come back
+        # as NEW every run.
+        pending = [old_job_ids[jid] for jid in tracker
+                   if jid in old_job_ids and jid not in new_job_ids]
+        scraper.current_listings = list(new_job_ids.values()) + pending
+
+        if updated_listings or {str(job.get_id()) for job in scraper.current_listings} != set(old_job_ids):
+            scraper.save()
+
+        return new_listings, updated_listings, confirmed_delisted
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,176 @@
+from lib.base_joblisting import JobListing
+from lib.base_scraper import JobScraper
+from lib import http_client
+from typing import List, Dict, Any, NamedTuple, Optional
+from html.parser import HTMLParser
+import logging
+import re
+
+
+class RMKRow(NamedTuple):
+    path: str
+    title: str
+    location: str
+    tile_id: str
+
+
+class RMKResultsParser(HTMLParser):
+    """Streaming tokenizer for SuccessFactors RMK search pages.
+
+    Emits one RMKRow per <tr class="data-row"> with the first a.jobTitle-link and
+    span.jobLocation inside it. No tree is built, so a results page costs one pass over
+    the markup instead of a full BeautifulSoup DOM.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.rows: List[RMKRow] = []
+        self._row: Optional[Dict[str, str]] = None
+        self._field = None
+        self._field_tag = None
+        self._depth = 0
+        self._text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if self._field is not None:
+            if tag == self._field_tag:
+                self._depth += 1
+            return
+
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+        if tag == "tr" and "data-row" in classes:
+            self._row = {"path": "", "title": "", "location": "", "tile_id": ""}
+        elif self._row is None:
+            return
+        elif tag == "a" and "jobTitle-link" in classes and not self._row["path"]:
+            self._row["path"] = attrs.get("href") or ""
+            self._row["tile_id"] = (attrs.get("data-focus-tile") or "").replace(".job-id-", "")
+            self._capture("title", tag)
+        elif tag == "span" and "jobLocation" in classes and not self._row["location"]:
+            self._capture("location", tag)
+
+    def handle_data(self, data):
+        if self._field is not None:
+            self._text.append(data)
+
+    def handle_endtag(self, tag):
+        if self._field is not None:
+            if tag != self._field_tag:
+                return
+            if self._depth:
+                self._depth -= 1
+                return
+            self._row[self._field] = " ".join("".join(self._text).split())
+            self._field = None
+        elif tag == "tr" and self._row is not None:
+            if self._row["path"]:
+                self.rows.append(RMKRow(**self._row))
+            self._row = None
+
+    def _capture(self, field: str, tag: str) -> None:
+        self._field, self._field_tag, self._depth, self._text = field, tag, 0, []
+
+
+def parse_rows(html: str) -> List[RMKRow]:
+    parser = RMKResultsParser()
+    parser.feed(html)
+    parser.close()
+    return parser.rows
+
+
+class SuccessFactorsJobListing(JobListing):
+    __slots__ = ("id", "title", "location", "link")
+
+    def __init__(self, listing_id: str, title: str, location: str, link: str):
+        self.id = listing_id
+        self.title = title
+        self.location = location
+        self.link = link
+
+
+class SuccessFactorsJobScraper(JobScraper):
+    """Scraper for SuccessFactors RMK career sites (`/search/?...optionsFacetsDD_*`).
+
+    Configured by the site's base URL and one or more search URLs, one per facet
+    combination. The searches run concurrently; within each, page 1 reports
+    "Page X of N" and pages 2..N are then fetched together.
+    """
+
+    listing_class = SuccessFactorsJobListing
+
+    TOTAL_PAGES = re.compile(r'Page\s+\d+\s+of\s+(\d+)')
+    LISTING_ID = re.compile(r'/(\d+)/')
+
+    def __init__(self, company_name: str, base_url: str, search_urls: List[str],
+                 logo_path: str = None, headers: Dict[str, str] = None, default_location: str = ""):
+        super().__init__(company_name=company_name)
+        self.base_url = base_url
+        self.search_urls = search_urls
+        self.logo_path = logo_path
+        self.headers = headers or {}
+        self.default_location = default_location
+
+    def _fetch_page(self, session: Any, search_url: str, page: int) -> Optional[str]:
+        url = search_url if page == 1 else f"{search_url}&page={page}"
+        response = self.fetch("GET", url, session=session)
+        if response.status_code != 200:
+            logging.error(f"{self.company} returned {response.status_code} for page {page}")
+            return None
+        return response.text
+
+    def _search(self, session: Any, search_url: str) -> Optional[List[str]]:
+        """All result pages of one search, or None if any of them failed."""
+        first = self._fetch_page(session, search_url, 1)
+        if first is None:
+            return None
+        match = self.TOTAL_PAGES.search(first)
+        total_pages = int(match.group(1)) if match else 1
+        rest = http_client.fetch_all(lambda page: self._fetch_page(session, search_url, page),
+                                     range(2, total_pages + 1))
+        if any(page is None for page in rest):
+            return None
+        return [first] + rest
+
+    def _matches(self, row: RMKRow) -> bool:
+        return True
+
+    def _make_listing(self, row: RMKRow) -> JobListing:
+        id_match = self.LISTING_ID.search(row.path)
+        return SuccessFactorsJobListing(
+            listing_id=id_match.group(1) if id_match else row.path,
+            title=row.title,
+            location=row.location or self.default_location,
+            link=f"{self.base_url}{row.path}"
+        )
+
+    def scrape(self) -> List[JobListing]:
+        listings = []
+        session = http_client.new_session()
+        session.headers.update(self.headers)
+
+        try:
+            searches = http_client.fetch_all(lambda url: self._search(session, url), self.search_urls)
+            if any(pages is None for pages in searches):
+                # A missing page would show up as delistings; skip the whole run instead.
+                return listings
+            if self.not_modified:
+                return listings
+
+            seen = set()
+            for pages in searches:
+                for html in pages:
+                    for row in parse_rows(html):
+                        if not self._matches(row):
+                            continue
+                        listing = self._make_listing(row)
+                        if listing.get_id() not in seen:
+                            seen.add(listing.get_id())
+                            listings.append(listing)
+
+            self.current_listings = listings
+
+        except Exception as e:
+            logging.error(f"Error scraping {self.company} jobs: {e}")
+
+        return listings
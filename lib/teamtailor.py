@@ -0,0 +1,116 @@
+from lib.base_joblisting import JobListing
+from lib.base_scraper import JobScraper
+from typing import List, Dict, Iterable, Iterator, Optional
+import xml.etree.ElementTree as ET
+import re
+import logging
+
+# Teamtailor job links look like https://careers.example.com/jobs/7996042-some-title
+JOB_ID = re.compile(r"/jobs/(\d+)-")
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+
+
+class TeamtailorJobListing(JobListing):
+    __slots__ = ("id", "title", "posted_date", "link")
+
+    def __init__(self, listing_id: str, title: str, posted_date: str, link: str):
+        self.id = listing_id
+        self.title = title
+        self.posted_date = posted_date
+        self.link = link
+
+
+def _text(element: ET.Element, tag: str) -> Optional[str]:
+    child = element.find(tag)
+    return child.text if child is not None else None
+
+
+def parse_feed(chunks: Iterable[bytes]) -> Iterator[Dict[str, str]]:
+    """Yield {"title", "link", "posted_date"} for every RSS <item> or Atom <entry>.
+
+    The feed is parsed as the chunks arrive, and every entry is cleared once read, so only
+    the current entry is ever held as elements. Entries without a title or link are skipped.
+    """
+    parser = ET.XMLPullParser(events=("end",))
+
+    def entries() -> Iterator[Dict[str, str]]:
+        for _, element in parser.read_events():
+            if element.tag == "item":
+                title, link = _text(element, "title"), _text(element, "link")
+                posted_date = _text(element, "pubDate")
+            elif element.tag == f"{ATOM}entry":
+                link_element = element.find(f"{ATOM}link")
+                title = _text(element, f"{ATOM}title")
+                link = link_element.get("href") if link_element is not None else None
+                posted_date = _text(element, f"{ATOM}published") or _text(element, f"{ATOM}updated")
+            else:
+                continue
+            element.clear()
+            if title is not None and link is not None:
+                yield {"title": title, "link": link, "posted_date": posted_date or ""}
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from entries()
+    parser.close()
+    yield from entries()
+
+
+class TeamtailorJobScraper(JobScraper):
+    """Scraper for any careers site hosted on Teamtailor, read through its jobs.rss feed.
+
+    Teamtailor filters the feed server-side, so a board is its host plus one query per
+    feed to read; postings that show up in several feeds are kept once:
+
+        TeamtailorJobScraper("Acme", "careers.acme.com",
+                             feeds=[{"country": "Switzerland", "department": "IT"}])
+
+    Every feed is a conditional GET parsed while it streams in, so an unchanged feed costs
+    a 304 (or one hashed download) and no parsing at all. If only some feeds changed, the
+    unchanged ones are read again without validators, since the listings are rebuilt from
+    every feed. Any failing feed fails the whole run rather than reporting a shorter board.
+    """
+
+    listing_class = TeamtailorJobListing
+
+    def __init__(self, company_name: str, host: str, feeds: Iterable[Dict[str, str]] = ({},),
+                 logo_path: str = None):
+        super().__init__(company_name=company_name)
+        self.rss_url = f"https://{host}/jobs.rss"
+        self.feeds = [dict(params) for params in feeds]
+        self.logo_path = logo_path
+
+    def _read_feed(self, params: Dict[str, str], conditional: bool = True) -> Optional[List[JobListing]]:
+        """Listings of one feed; None if the feed is unchanged since the last run."""
+        with self.open_stream(self.rss_url, conditional=conditional, params=params) as body:
+            if body is None:
+                return None
+            return [self._make_listing(entry) for entry in parse_feed(body)]
+
+    def _make_listing(self, entry: Dict[str, str]) -> JobListing:
+        match = JOB_ID.search(entry["link"])
+        return self.listing_class(
+            listing_id=match.group(1) if match else entry["link"],
+            title=entry["title"],
+            posted_date=entry["posted_date"],
+            link=entry["link"]
+        )
+
+    def scrape(self) -> List[JobListing]:
+        try:
+            feeds = [self._read_feed(params) for params in self.feeds]
+            if self.not_modified:
+                return self.current_listings
+            listings = {}
+            for params, feed in zip(self.feeds, feeds):
+                if feed is None:
+                    feed = self._read_feed(params, conditional=False)
+                for listing in feed:
+                    listings.setdefault(listing.get_id(), listing)
+        except Exception as e:
+            logging.error(f"Error scraping {self.company} jobs: {e}")
+            return []
+
+        self.current_listings = list(listings.values())
+        return self.current_listings
@@ -1,30 +1,20 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
+from lib import http_client
 from typing import List, Dict, Any
-import requests
 import logging
 
 
 class UBSJobListing(JobListing):
+    __slots__ = ("id", "title", "location", "department", "link")
+    company = "UBS"
+
     def __init__(self, listing_id: str, title: str, location: str, department: str, link: str):
         self.id = listing_id
         self.title = title
         self.location = location
         self.department = department
         self.link = link
-        self.company = "UBS"
-
-    def get_id(self) -> str:
-        return self.id
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "location": self.location,
-            "department": self.department,
-            "link": self.link
-        }
 
 
 class UBSJobScraper(JobScraper):
@@ -36,6 +26,8 @@ class UBSJobScraper(JobScraper):
     all UBS jobs globally, so we filter to Switzerland via the formtext23 location field.
     """
 
+    listing_class = UBSJobListing
+
     PARTNER_ID = "25008"
     SITE_ID = "5012"
     LINK_ID = "15231"
@@ -98,7 +90,7 @@ class UBSJobScraper(JobScraper):
         return result
 
     def scrape(self) -> List[UBSJobListing]:
-        session = requests.Session()
+        session = http_client.new_session()
         session.headers.update({"User-Agent": self.user_agent})
 
         try:
@@ -174,12 +166,3 @@ class UBSJobScraper(JobScraper):
         except Exception as e:
             logging.error(f"Error scraping UBS jobs: {e}")
             return []
-
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> UBSJobListing:
-        return UBSJobListing(
-            listing_id=data["id"],
-            title=data["title"],
-            location=data["location"],
-            department=data["department"],
-            link=data["link"]
-        )
@@ -1,13 +1,13 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
-import requests
+from lib import http_client, embedded_json
+from typing import List
 import logging
-import re
-import json
 
 
 class VontobelJobListing(JobListing):
+    __slots__ = ("id", "title", "location", "department", "link")
+
     def __init__(self, listing_id: str, title: str, location: str, department: str, link: str):
         self.id = listing_id
         self.title = title
@@ -15,20 +15,10 @@ class VontobelJobListing(JobListing):
         self.department = department
         self.link = link
 
-    def get_id(self) -> str:
-        return self.id
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "location": self.location,
-            "department": self.department,
-            "link": self.link
-        }
-
 
 class VontobelJobScraper(JobScraper):
+    listing_class = VontobelJobListing
+
     def __init__(self):
         super().__init__(company_name="Vontobel")
         self.logo_path = "lib/vontobel.png"
@@ -42,7 +32,7 @@ class VontobelJobScraper(JobScraper):
         listings = []
 
         try:
-            response = requests.get(self.url, headers=self.headers, timeout=15)
+            response = http_client.get(self.url, headers=self.headers, timeout=15)
             if response.status_code != 200:
                 logging.error(f"Vontobel returned {response.status_code}")
                 return listings
@@ -73,37 +63,4 @@ class VontobelJobScraper(JobScraper):
 
     def _extract_jobs(self, html: str) -> list:
         """Extract jobs array from embedded Next.js RSC data."""
-        idx = html.find('\\"jobs\\":[{')
-        if idx == -1:
-            return []
-
-        start = idx + len('\\"jobs\\":')
-        bracket = 0
-        i = start
-        while i < len(html):
-            if html[i:i+2] == '\\"':
-                i += 2
-                continue
-            if html[i] == '[':
-                bracket += 1
-            elif html[i] == ']':
-                bracket -= 1
-                if bracket == 0:
-                    end = i + 1
-                    break
-            i += 1
-        else:
-            return []
-
-        jobs_escaped = html[start:end]
-        jobs_json = jobs_escaped.replace('\\"', '"').replace('\\\\', '\\')
-        return json.loads(jobs_json)
-
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> VontobelJobListing:
-        return VontobelJobListing(
-            listing_id=data["id"],
-            title=data["title"],
-            location=data["location"],
-            department=data["department"],
-            link=data["link"]
-        )
+        return embedded_json.find_value(embedded_json.next_flight(html), "jobs", "[{") or []
@@ -0,0 +1,96 @@
+from lib.base_joblisting import JobListing
+from lib.base_scraper import JobScraper
+from lib import http_client
+from typing import List, Dict, Any, Tuple
+import logging
+
+
+class WorkdayJobListing(JobListing):
+    __slots__ = ("id", "title", "locations", "link")
+
+    def __init__(self, listing_id: str, title: str, locations: str, link: str):
+        self.id = listing_id
+        self.title = title
+        self.locations = locations
+        self.link = link
+
+
+class WorkdayJobScraper(JobScraper):
+    """Scraper for a Workday career site via its CXS jobs API.
+
+    A site is described by its host, tenant, site name and the applied facets, e.g.
+
+        WorkdayJobScraper("Acme", "acme.wd3.myworkdayjobs.com", "acme", "External",
+                          {"locationHierarchy1": ["<facet id>"]})
+
+    The first page reports the total; the remaining offsets are then fetched together.
+    Every tenant has its own hostname, so the per-host limiter already throttles each
+    tenant separately. Payloads are built per request, so instances share no state.
+    """
+
+    listing_class = WorkdayJobListing
+
+    # Workday rejects pages larger than 20.
+    PAGE_SIZE = 20
+
+    def __init__(self, company_name: str, host: str, tenant: str, site: str,
+                 facets: Dict[str, List[str]], logo_path: str = None):
+        super().__init__(company_name=company_name)
+        self.host = host
+        self.tenant = tenant
+        self.site = site
+        self.facets = facets
+        self.logo_path = logo_path
+        self.api_url = f"https://{host}/wday/cxs/{tenant}/{site}/jobs"
+
+    def _open_session(self) -> Tuple[Any, Dict[str, str]]:
+        """Client and extra headers for the jobs API; sites behind a CSRF handshake override this."""
+        return http_client, {}
+
+    def _payload(self, offset: int) -> Dict[str, Any]:
+        return {
+            "appliedFacets": self.facets,
+            "limit": self.PAGE_SIZE,
+            "offset": offset,
+            "searchText": "",
+        }
+
+    def _fetch_page(self, client: Any, headers: Dict[str, str], offset: int) -> Dict[str, Any]:
+        response = client.post(self.api_url, json=self._payload(offset), headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    def _make_listing(self, job: Dict[str, Any]) -> JobListing:
+        return WorkdayJobListing(
+            listing_id=job.get('bulletFields', [None])[0],
+            title=job.get('title'),
+            locations=job.get('locationsText'),
+            link=f"https://{self.host}/en-US/{self.site}{job.get('externalPath')}"
+        )
+
+    def scrape(self) -> List[JobListing]:
+        listings = []
+
+        try:
+            client, headers = self._open_session()
+            if client is None:
+                return listings
+
+            first = self._fetch_page(client, headers, 0)
+            total = first.get('total', 0)
+            offsets = range(self.PAGE_SIZE, total, self.PAGE_SIZE)
+            pages = [first] + http_client.fetch_all(
+                lambda offset: self._fetch_page(client, headers, offset), offsets)
+        except Exception as e:
+            # A missing page would show up as delistings; skip the whole run instead.
+            logging.error(f"{self.company} Workday scrape failed: {e}")
+            return listings
+
+        for data in pages:
+            for job in data.get('jobPostings', []):
+                if not job.get('title') or not job.get('externalPath'):
+                    continue
+                listings.append(self._make_listing(job))
+
+        self.current_listings = listings
+        return listings
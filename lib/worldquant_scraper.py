@@ -1,35 +1,27 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
+from lib import http_client
+from typing import List
 from bs4 import BeautifulSoup
-import requests
 import logging
 import re
 
 
 class WorldQuantJobListing(JobListing):
+    __slots__ = ("id", "title", "location", "department", "link")
+    company = "WorldQuant"
+
     def __init__(self, listing_id: str, title: str, location: str, department: str, link: str):
         self.id = listing_id
         self.title = title
         self.location = location
         self.department = department
         self.link = link
-        self.company = "WorldQuant"
-
-    def get_id(self) -> str:
-        return self.id
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "location": self.location,
-            "department": self.department,
-            "link": self.link
-        }
 
 
 class WorldQuantJobScraper(JobScraper):
+    listing_class = WorldQuantJobListing
+
     # WorldQuant has Swiss offices in Zug and Geneva; a posting's data-location is a
     # pipe-separated list of office slugs, so keep any posting that includes one.
     CH_LOCATION_SLUGS = ("zug-switzerland", "geneva-switzerland")
@@ -47,7 +39,7 @@ class WorldQuantJobScraper(JobScraper):
         listings = []
 
         try:
-            response = requests.get(self.url, headers=self.headers, timeout=20)
+            response = http_client.get(self.url, headers=self.headers, timeout=20)
             if response.status_code != 200:
                 logging.error(f"WorldQuant returned {response.status_code}")
                 return listings
@@ -93,12 +85,3 @@ class WorldQuantJobScraper(JobScraper):
             logging.error(f"Error scraping WorldQuant jobs: {e}")
 
         return listings
-
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> WorldQuantJobListing:
-        return WorldQuantJobListing(
-            listing_id=data["id"],
-            title=data["title"],
-            location=data["location"],
-            department=data["department"],
-            link=data["link"]
-        )
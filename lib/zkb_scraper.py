@@ -1,40 +1,30 @@
 from lib.base_joblisting import JobListing
 from lib.base_scraper import JobScraper
-from typing import List, Dict, Any
+from lib import http_client
+from typing import List, Any
 from bs4 import BeautifulSoup
-import requests
 import logging
 import re
 
 
 class ZKBJobListing(JobListing):
+    __slots__ = ("id", "title", "link", "locations", "division", "position", "workload")
+    FIELDS = ("id", "title", "link", "company", "locations", "division", "position", "workload")
+    company = "ZKB"
+
     def __init__(self, listing_id: str, title: str, link: str, locations: List[str], division: str, position: str, workload: str):
         self.id = listing_id
         self.title = title
         self.link = link
-        self.company = "ZKB"
         self.locations = locations
         self.division = division
         self.position = position
         self.workload = workload
 
-    def get_id(self) -> str:
-        return self.id
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "title": self.title,
-            "link": self.link,
-            "company": self.company,
-            "locations": self.locations,
-            "division": self.division,
-            "position": self.position,
-            "workload": self.workload,
-        }
-
 
 class ZKBJobScraper(JobScraper):
+    listing_class = ZKBJobListing
+
     FILTER_AREAS = {
         "Asset Management / Portfolio Management",
         "IT / Business Engineering",
@@ -51,7 +41,7 @@ class ZKBJobScraper(JobScraper):
         self.logo_path = "lib/zkb.png"
 
     def scrape(self) -> List[ZKBJobListing]:
-        response = requests.get(self.start_url)
+        response = http_client.get(self.start_url)
         if response.status_code != 200:
             logging.error(f"Could not scrape ZKB (status={response.status_code})")
             return []
@@ -95,14 +85,3 @@ class ZKBJobScraper(JobScraper):
         position = title
 
         return ZKBJobListing(listing_id, title, link, locations, division, position, workload)
-
-    def _create_listing_from_dict(self, data: Dict[str, Any]) -> ZKBJobListing:
-        return ZKBJobListing(
-            data["id"],
-            data["title"],
-            data["link"],
-            data["locations"],
-            data["division"],
-            data["position"],
-            data["workload"],
-        )
@@ -1,75 +1,47 @@
+import argparse
 import logging
-import requests
+import sys
+import threading
 import time
 import json
 import os
+import re
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from lib.google_scraper import GoogleJobScraper
-from lib.meta_scraper import MetaJobScraper
-from lib.nvidia_scraper import NvidiaJobScraper
-from lib.apple_scraper import AppleJobScraper
-from lib.microsoft_scraper import MicrosoftJobScraper
-from lib.snap_scraper import SnapJobScraper
-from lib.amazon_scraper import AmazonJobScraper
-from lib.bkw_scraper import BKWJobScraper
-from lib.lgtcp_scraper import LGTCPJobScraper
-from lib.juliusbaer_scraper import JBJobScraper
-from lib.lgt_scraper import LGTJobScraper
-from lib.zkb_scraper import ZKBJobScraper
-from lib.alpiq_scraper import AlpiqJobScraper
-from lib.metgroup_scraper import METJobScraper
-from lib.citadel_scraper import CitadelJobScraper
-from lib.qrt_scraper import QRTJobScraper
-from lib.getyourguide_scraper import GetYourGuideJobScraper
-from lib.ibm_scraper import IBMJobScraper
-from lib.oracle_scraper import OracleJobScraper
-from lib.axpo_scraper import AxpoJobScraper
-from lib.bundesverwaltung_scraper import BundesverwaltungJobScraper
-from lib.imc_scraper import IMCJobScraper
-from lib.mathrix_scraper import MathrixJobScraper
-from lib.sbb_scraper import SBBJobScraper
-from lib.swisscom_scraper import SwisscomJobScraper
-from lib.swissre_scraper import SwissReJobScraper
-from lib.zurich_scraper import ZurichJobScraper
-from lib.postfinance_scraper import PostFinanceJobScraper
-from lib.mobiliar_scraper import MobiliarJobScraper
-from lib.redhat_scraper import RedHatJobScraper
-from lib.databricks_scraper import DatabricksJobScraper
-from lib.millennium_scraper import MillenniumJobScraper
-from lib.vontobel_scraper import VontobelJobScraper
-from lib.snb_scraper import SNBJobScraper
-from lib.adobe_scraper import AdobeJobScraper
-from lib.six_scraper import SIXJobScraper
-from lib.deepmind_scraper import DeepMindJobScraper
-from lib.anthropic_scraper import AnthropicJobScraper
-from lib.thomsonreuters_scraper import ThomsonReutersJobScraper
-from lib.squarepoint_scraper import SquarepointJobScraper
-from lib.man_scraper import ManJobScraper
-from lib.worldquant_scraper import WorldQuantJobScraper
-from lib.openai_scraper import OpenAIJobScraper
-from lib.palantir_scraper import PalantirJobScraper
-from lib.ubs_scraper import UBSJobScraper
-from lib.raiffeisen_scraper import RaiffeisenJobScraper
-from lib.partnersgroup_scraper import PartnersGroupJobScraper
-from lib.isomorphic_scraper import IsomorphicJobScraper
-from lib.glencore_scraper import GlencoreJobScraper
-from lib.huawei_scraper import HuaweiJobScraper
-from lib.post_scraper import PostJobScraper
-
-# Change the working directory to the script's directory
-os.chdir(os.path.dirname(os.path.abspath(__file__)))
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("scraper.log"),
-        logging.StreamHandler()
-    ]
-)
-
-with open('creds.txt', 'r') as file:
-    telegram_acc = json.load(file)
+from lib import registry
+from lib.rate_limiter import limiter
+from lib.state_store import JsonListingStore
+from lib.sqlite_store import SQLiteListingStore
+from lib import http_client
+from lib import durable
+
+# Scrapers spend nearly all their time waiting on the network, so run them from a
+# bounded thread pool instead of one after another. A full run then takes roughly as
+# long as the slowest scraper rather than the sum of all of them.
+MAX_WORKERS = 16
+
+# "json" keeps each company's state in its own folder; "sqlite" keeps every company in
+# one WAL-mode database, which stays flat as the number of companies grows.
+STATE_BACKEND = os.environ.get("JOB_SCRAPER_STATE", "json")
+
+# Per-company record of the last successful run, read by --only-due. It lives in the
+# company's folder so shards running at the same time never write the same file.
+LAST_RUN = "last_run.json"
+
+# A company counts as due slightly before its interval is up, so a cron job firing every
+# hour does not skip an hourly company because the previous run started a few seconds late.
+DUE_SLACK = timedelta(minutes=5)
+
+# Markdown control characters, dropped from free text such as detail summaries.
+_MARKDOWN = re.compile(r"[*_`\[\]]")
+
+# Attempts per Telegram call when it answers 429 Too Many Requests.
+TELEGRAM_ATTEMPTS = 3
+
+# Held while one company's notification is sent, so its photo and follow-up chunks
+# arrive together instead of interleaved with another company's.
+_telegram_lock = threading.Lock()
 
 
 def chunk_by_jobs(jobs_list, header="", max_length=1000):
@@ -90,25 +62,18 @@ def chunk_by_jobs(jobs_list, header="", max_length=1000):
     return chunks
 
 
-DELIST_GRACE_HOURS = 6
-
-
-def load_delisting_tracker(folder: str) -> dict:
-    path = os.path.join(folder, "delisting_tracker.json")
-    if not os.path.exists(path):
-        return {}
-    try:
-        with open(path, "r") as f:
-            return json.load(f)
-    except Exception:
-        return {}
-
-
-def save_delisting_tracker(folder: str, tracker: dict):
-    path = os.path.join(folder, "delisting_tracker.json")
-    os.makedirs(folder, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(tracker, f)
+def post_telegram(url: str, **kwargs):
+    """POST to the Telegram API, waiting out 429 responses as long as they ask to."""
+    for attempt in range(TELEGRAM_ATTEMPTS):
+        r = http_client.post(url, **kwargs)
+        if r.status_code != 429 or attempt == TELEGRAM_ATTEMPTS - 1:
+            return r
+        try:
+            retry_after = r.json().get("parameters", {}).get("retry_after", 1)
+        except ValueError:
+            retry_after = 1
+        logging.warning(f"Telegram rate limit hit, retrying in {retry_after}s")
+        time.sleep(retry_after)
 
 
 def send_telegram_message(bot_token: str, chat_id: str, text: str):
@@ -120,7 +85,7 @@ def send_telegram_message(bot_token: str, chat_id: str, text: str):
         "parse_mode": "Markdown",
         "disable_web_page_preview": True
     }
-    r = requests.post(url, data=payload)
+    r = post_telegram(url, data=payload)
     if r.status_code != 200:
         logging.error(f"Telegram error {r.status_code}: {r.text}")
 
@@ -129,7 +94,9 @@ def send_telegram_message(bot_token: str, chat_id: str, text: str):
 def send_telegram_photo_with_text(bot_token: str, chat_id: str, file_path: str, text_chunks: list):
     """Send a photo with first text chunk as caption, and extra chunks as messages."""
     url = f"https://api.telegram.org/bot{bot_token}/sendPhoto"
-    files = {'photo': open(file_path, 'rb')}
+    with open(file_path, 'rb') as f:
+        # Read up front so a retried request sends the whole photo again.
+        files = {'photo': (os.path.basename(file_path), f.read())}
 
     # First chunk as caption (if possible)
     caption = text_chunks[0] if text_chunks else None
@@ -137,7 +104,7 @@ def send_telegram_photo_with_text(bot_token: str, chat_id: str, file_path: str,
     if caption:
         payload["caption"] = caption
 
-    r = requests.post(url, data=payload, files=files)
+    r = post_telegram(url, data=payload, files=files)
     if r.status_code != 200:
         logging.error(f"Telegram photo error {r.status_code}: {r.text}")
         return
@@ -147,91 +114,62 @@ def send_telegram_photo_with_text(bot_token: str, chat_id: str, file_path: str,
         send_telegram_message(bot_token, chat_id, chunk)
 
 
-# --- Main Loop ---
-scrapers = [GoogleJobScraper(), MetaJobScraper(), NvidiaJobScraper(),
-            AppleJobScraper(), MicrosoftJobScraper(), SnapJobScraper(), AmazonJobScraper(),
-            BKWJobScraper(), LGTCPJobScraper(), JBJobScraper(), LGTJobScraper(), ZKBJobScraper(),
-            AlpiqJobScraper(), METJobScraper(), CitadelJobScraper(), QRTJobScraper(),
-            GetYourGuideJobScraper(), IBMJobScraper(), OracleJobScraper(), AxpoJobScraper(),
-            BundesverwaltungJobScraper(), IMCJobScraper(), MathrixJobScraper(), SBBJobScraper(),
-            SwisscomJobScraper(), SwissReJobScraper(), ZurichJobScraper(),
-            PostFinanceJobScraper(), MobiliarJobScraper(), RedHatJobScraper(),
-            DatabricksJobScraper(), MillenniumJobScraper(),
-            VontobelJobScraper(), SNBJobScraper(), AdobeJobScraper(),
-            SIXJobScraper(), DeepMindJobScraper(), AnthropicJobScraper(),
-            ThomsonReutersJobScraper(), SquarepointJobScraper(), ManJobScraper(),
-            WorldQuantJobScraper(), OpenAIJobScraper(), PalantirJobScraper(),
-            UBSJobScraper(), RaiffeisenJobScraper(), PartnersGroupJobScraper(),
-            IsomorphicJobScraper(), GlencoreJobScraper(), HuaweiJobScraper(),
-            PostJobScraper()]
-for scraper in scrapers:
+def process_scraper(scraper, store, telegram_acc) -> bool:
+    """Scrape one company, diff against its saved state and notify about changes.
+
+    Everything here only touches the company's own state, so several companies can
+    be processed at the same time from the worker pool. Returns False if the company
+    should be retried on the next run (scraper error or an empty scrape).
+    """
     logging.info(f"Starting scraper for {scraper.company}")
     try:
-        old_jobs = scraper.load_previous_state()
         new_jobs = scraper.scrape()
 
-        if not new_jobs and old_jobs:
-            logging.warning(f"{scraper.company} - scrape returned 0 results, skipping (possible maintenance)")
-            continue
-
-        old_job_ids = {job.get_id(): job for job in old_jobs}
-        new_job_ids = {job.get_id(): job for job in new_jobs}
+        if scraper.not_modified:
+            if not store.has_pending(scraper):
+                logging.info(f"{scraper.company} - unchanged since last run, skipped parsing")
+                return True
+            # Nothing was downloaded, but pending delistings still have to age out: the
+            # board is exactly the saved state minus the jobs already missing from it.
+            new_jobs = store.live_listings(scraper)
 
-        tracker = load_delisting_tracker(scraper.company)
-        now = datetime.now().isoformat()
-        cutoff = (datetime.now() - timedelta(hours=DELIST_GRACE_HOURS)).isoformat()
-
-        # Jobs that disappeared: add to tracker if not already tracked
-        disappeared = {jid for jid in old_job_ids if jid not in new_job_ids}
-        for jid in disappeared:
-            if jid not in tracker:
-                tracker[jid] = now
-
-        # Only report delistings past the grace period
-        confirmed_delisted = [old_job_ids[jid] for jid in disappeared
-                              if tracker.get(jid, now) <= cutoff and jid in old_job_ids]
-
-        # Remove confirmed delistings from tracker
-        for job in confirmed_delisted:
-            tracker.pop(job.get_id(), None)
-
-        # New listings: only report if not in tracker (i.e. not a flicker reappearance)
-        new_listings = [job for jid, job in new_job_ids.items()
-                        if jid not in old_job_ids and jid not in tracker]
-
-        # Jobs that reappeared: silently remove from tracker (after new_listings check)
-        for jid in list(tracker.keys()):
-            if jid in new_job_ids:
-                del tracker[jid]
-
-        # Drop stale entries: past the grace period and no longer in the saved state,
-        # so they can never be reported as delisted - they would only suppress a
-        # future NEW for that job forever.
-        for jid in list(tracker.keys()):
-            if jid not in old_job_ids and tracker[jid] <= cutoff:
-                del tracker[jid]
+        if not new_jobs and store.has_state(scraper):
+            logging.warning(f"{scraper.company} - scrape returned 0 results, skipping (possible maintenance)")
+            return False
 
-        save_delisting_tracker(scraper.company, tracker)
+        new_listings, updated_listings, confirmed_delisted = store.sync(scraper, new_jobs)
 
-        # Persist the scrape plus anything still inside its delisting grace period.
-        # Saving only the raw scrape would drop a flickering job from the state while
-        # the tracker still holds it, and once the tracker clears it would come back
-        # as NEW every run.
-        pending = [old_job_ids[jid] for jid in tracker
-                   if jid in old_job_ids and jid not in new_job_ids]
-        scraper.current_listings = list(new_job_ids.values()) + pending
+        # The state now matches what was downloaded, so its validators can be kept.
+        if scraper.http_cache is not None:
+            scraper.http_cache.commit()
 
-        if {job.get_id() for job in scraper.current_listings} != set(old_job_ids):
-            scraper.save()
+        # Descriptions and other heavy fields are only worth fetching for jobs nobody has
+        # seen yet; failing to get them must not hold back the notification.
+        if new_listings:
+            try:
+                scraper.load_details(new_listings)
+            except Exception as e:
+                logging.warning(f"{scraper.company} - could not load job details: {e}")
 
-        if new_listings or confirmed_delisted:
-            logging.info(f"{scraper.company} - {len(new_listings)} new, {len(confirmed_delisted)} delisted jobs")
+        if new_listings or updated_listings or confirmed_delisted:
+            logging.info(f"{scraper.company} - {len(new_listings)} new, {len(updated_listings)} updated, "
+                         f"{len(confirmed_delisted)} delisted jobs")
 
             message_lines = []
 
             if new_listings:
                 message_lines.append(f"*NEW* ({scraper.company})")
                 for job in new_listings:
+                    line = f"{job.title} - [Link]({job.link})"
+                    summary = (job.details or {}).get("summary")
+                    if summary:
+                        # One entry, so chunking never separates a job from its summary.
+                        line += "\n" + _MARKDOWN.sub("", summary)
+                    message_lines.append(line)
+
+            if updated_listings:
+                message_lines.append(f"\n*UPDATED* ({scraper.company})")
+                for job in updated_listings:
                     message_lines.append(f"{job.title} - [Link]({job.link})")
 
             if confirmed_delisted:
@@ -243,17 +181,132 @@ for scraper in scrapers:
             chunks = chunk_by_jobs(message_lines)
 
             # Send one message per Telegram account
-            for acc in telegram_acc:
-                if os.path.exists(scraper.logo_path):
-                    send_telegram_photo_with_text(acc["token"], acc["chat_id"], scraper.logo_path, chunks)
-                else:
-                    for chunk in chunks:
-                        send_telegram_message(acc["token"], acc["chat_id"], chunk)
+            with _telegram_lock:
+                for acc in telegram_acc:
+                    if os.path.exists(scraper.logo_path):
+                        send_telegram_photo_with_text(acc["token"], acc["chat_id"], scraper.logo_path, chunks)
+                    else:
+                        for chunk in chunks:
+                            send_telegram_message(acc["token"], acc["chat_id"], chunk)
 
         else:
             logging.info(f"{scraper.company} - no changes")
-
-        time.sleep(1)
+        return True
 
     except Exception as e:
         logging.exception(f"{scraper.company} - Scraper Error: {e}")
+        return False
+
+
+def last_run(company: str):
+    path = os.path.join(company, LAST_RUN)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as f:
+        return datetime.fromisoformat(json.load(f)["started"])
+
+
+def is_due(spec, now: datetime) -> bool:
+    previous = last_run(spec.company)
+    return previous is None or now - previous >= timedelta(hours=spec.interval_hours) - DUE_SLACK
+
+
+def parse_shard(value: str):
+    """'i/N' -> (i, N) with 0 <= i < N."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected I/N, got {value!r}")
+    if not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"shard index must be in 0..{count - 1}, got {index}")
+    return index, count
+
+
+def in_shard(company: str, shard) -> bool:
+    # crc32 rather than hash(): string hashes change between processes, and every cron
+    # job has to agree on the split.
+    index, count = shard
+    return zlib.crc32(company.encode()) % count == index
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape job boards and send new, updated and delisted jobs to Telegram.")
+    parser.add_argument("--include", action="append", default=[], metavar="NAME",
+                        help="only companies whose name contains NAME (case-insensitive, repeatable)")
+    parser.add_argument("--exclude", action="append", default=[], metavar="NAME",
+                        help="skip companies whose name contains NAME (case-insensitive, repeatable)")
+    parser.add_argument("--shard", type=parse_shard, metavar="I/N",
+                        help="run only shard I of N (0 <= I < N); every company lands in exactly one shard")
+    parser.add_argument("--only-due", action="store_true",
+                        help="run only companies whose interval has passed since their last successful run")
+    return parser.parse_args(argv)
+
+
+def select_specs(args, now: datetime):
+    specs = registry.select(args.include)
+    excluded = [name.lower() for name in args.exclude]
+    specs = [spec for spec in specs if not any(name in spec.company.lower() for name in excluded)]
+    if args.shard:
+        specs = [spec for spec in specs if in_shard(spec.company, args.shard)]
+    if args.only_due:
+        specs = [spec for spec in specs if is_due(spec, now)]
+    return specs
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    # Change the working directory to the script's directory
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler("scraper.log"),
+            logging.StreamHandler()
+        ]
+    )
+
+    with open('creds.txt', 'r') as file:
+        telegram_acc = json.load(file)
+
+    started = datetime.now()
+    specs = select_specs(args, started)
+    if not specs:
+        logging.info("No companies selected")
+        return 0
+
+    store = SQLiteListingStore("listings.db") if STATE_BACKEND == "sqlite" else JsonListingStore()
+
+    # Only the selected scrapers' modules are imported.
+    scrapers = [spec.create() for spec in specs]
+
+    # Caches are enabled before any scraper runs: batched adapters (Greenhouse) fetch other
+    # companies' boards before those companies get their own turn in the pool. Only revalidate
+    # against a previous run whose state we still have.
+    for scraper in scrapers:
+        if store.has_state(scraper):
+            scraper.enable_http_cache()
+
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        succeeded = list(pool.map(lambda scraper: process_scraper(scraper, store, telegram_acc), scrapers))
+    store.close()
+
+    for scraper, ok in zip(scrapers, succeeded):
+        if ok:
+            durable.write_json(os.path.join(scraper.company, LAST_RUN), {"started": started.isoformat()})
+
+    # Every state file was fsynced and renamed as it was written; make the renames durable.
+    durable.sync_dirs()
+    logging.info(f"Finished {len(scrapers)} scrapers in {time.time() - start:.1f}s")
+
+    for host, stats in sorted(limiter.stats().items(), key=lambda kv: -kv[1]["waited"]):
+        if stats["waited"]:
+            logging.info(f"Rate limit {host}: {stats['requests']} requests, waited {stats['waited']:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())